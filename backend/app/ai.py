@@ -1,10 +1,22 @@
 """AI/LLM integration module for generating Scrum artifacts."""
-import json
-from typing import Any, Dict, List, Optional
+import asyncio
+import logging
+import math
+from contextlib import nullcontext
+from functools import cached_property, lru_cache
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
 import re
 
+import httpx
+import orjson
+from aiolimiter import AsyncLimiter
 from openai import AsyncAzureOpenAI, AsyncOpenAI
 
+try:
+    import aiohttp
+except ImportError:  # Optional: only needed for the AI_FAST_PATH transport
+    aiohttp = None
+
 from .config import Settings, get_settings
 from .schemas import (
     SprintTask,
@@ -15,79 +27,337 @@ from .schemas import (
     UserStory,
 )
 
+logger = logging.getLogger(__name__)
+
+# Precompiled patterns used by the text-cleaning and mock-generation helpers
+# Deletes every delimiter character; a line is "all delimiters" if nothing but
+# whitespace survives the translation
+_DELIM_TABLE = str.maketrans('', '', '=-*#_|~`')
+# Any run of 3+ of the same delimiter character (===, ---, ***, |||, ...)
+_DELIM_RUN_RE = re.compile(r'([=\-_\*#~`\|])\1{2,}')
+
+# Leading list number and/or bullet marker ("1. ", "- ", "1. - ") stripped in one scan
+_LEADING_MARKER_RE = re.compile(r'^(?:\d+\.\s*)?(?:[-\*•]\s*)?')
+_ACTION_RE1 = re.compile(
+    r'^(?:the\s+)?(\w+(?:\s+\w+)?)\s+(?:need|want|should|must|can|will)\s+(?:to\s+)?(.+)',
+    re.IGNORECASE,
+)
+_ACTION_RE2 = re.compile(r'^(?:we\s+)?(?:need|want|should|must)\s+(?:to\s+)?(.+)', re.IGNORECASE)
+_PERIOD_RE = re.compile(r'(?<!\d)\.\s')
+
+_KEY_PHRASE_PATTERNS = [
+    # "Users need password reset" -> "Password Reset"
+    (re.compile(r'(?:need|want|require)s?\s+(?:a\s+|the\s+)?(.+?)(?:\s+so\s+that|\s+in\s+order\s+to|$)', re.IGNORECASE), 1),
+    # "implement two-factor authentication" -> "Two-Factor Authentication"
+    (re.compile(r'(?:implement|create|build|add|develop)\s+(?:a\s+|the\s+)?(.+?)(?:\s+so\s+that|\s+in\s+order\s+to|$)', re.IGNORECASE), 1),
+    # "ability to view all users" -> "View All Users"
+    (re.compile(r'ability\s+to\s+(.+?)(?:\s+so\s+that|\s+in\s+order\s+to|$)', re.IGNORECASE), 1),
+    # "be able to reset password" -> "Reset Password"
+    (re.compile(r'be\s+able\s+to\s+(.+?)(?:\s+so\s+that|\s+in\s+order\s+to|$)', re.IGNORECASE), 1),
+]
+
+# Cheap pre-check: every key phrase pattern needs one of these words to match
+_KEY_PHRASE_TRIGGER_RE = re.compile(
+    r'need|want|require|implement|create|build|add|develop|ability|able', re.IGNORECASE
+)
+
+# Words that mark a meeting-notes line as a likely requirement (substring match)
+_KEYWORD_RE = re.compile(
+    r'need|want|should|must|require|feature|user|admin|customer|ability', re.IGNORECASE
+)
+
+_ROLE_PREFIX_RE = re.compile(
+    r'^(?:the\s+)?(?:admin|user|customer|manager)\s+(?:team\s+)?(?:wants?\s+to\s+|needs?\s+to\s+)?'
+)
+
+# One line of the formatted standup prompt: "**Name**:" or "- Yesterday/Today/Blockers: ..."
+_STANDUP_LINE_RE = re.compile(
+    r'^\s*\*\*(?P<name>[^*]+)\*\*:'
+    r'|^\s*-\s*Yesterday:(?P<yesterday>.*)$'
+    r'|^\s*-\s*Today:(?P<today>.*)$'
+    r'|^\s*-\s*Blockers:(?P<blockers>.*)$',
+    re.MULTILINE,
+)
+
+# Ask the provider for a syntactically valid JSON object response
+_JSON_RESPONSE_FORMAT = {"type": "json_object"}
+
+# Per-entry block of the standup prompt (parsed back by _STANDUP_LINE_RE in mock mode)
+_STANDUP_ENTRY_TEMPLATE = "**{name}**:\n- Yesterday: {yesterday}\n- Today: {today}\n- Blockers: {blockers}"
+
+
+# Not memoized: it runs once per prompt, on text up to the upload size limit
+def _clean_text(text: str) -> str:
+    """Clean text by removing delimiter characters and formatting artifacts."""
+    if not text:
+        return text
+
+    # Remove common delimiter patterns
+    # Remove lines that are mostly delimiter characters
+    lines = text.split('\n')
+    cleaned_lines = []
+    for line in lines:
+        stripped = line.strip()
+        # Skip lines that are mostly delimiters (=, -, *, #, etc.)
+        if stripped and stripped.translate(_DELIM_TABLE).strip():
+            # Also remove inline delimiter sequences (needs at least 3 chars)
+            cleaned = _DELIM_RUN_RE.sub('', stripped).strip() if len(stripped) >= 3 else stripped
+            if cleaned:
+                cleaned_lines.append(cleaned)
+
+    return '\n'.join(cleaned_lines)
+
+
+# Title helpers are pure functions of their arguments, so they are memoized:
+# the mock generators call them repeatedly with the same lines.
+@lru_cache(maxsize=1024)
+def _create_short_title(text: str, max_length: int = 60) -> str:
+    """Create a short, complete title from text without cutting words mid-sentence."""
+    if not text:
+        return "Untitled Task"
+
+    # Clean the text first
+    text = text.strip()
+
+    # Remove leading numbers/bullets (e.g., "1. ", "2. ", "- ", "* ")
+    text = _LEADING_MARKER_RE.sub('', text, count=1)
+    text = text.strip()
+
+    # If already short enough, return as is
+    if len(text) <= max_length:
+        return text
+
+    # Extract the key action/subject from the text
+    # Look for common patterns and extract meaningful phrases
+
+    # If text starts with common phrases, try to extract the main subject
+    lower_text = text.lower()
+
+    # For "Users need to...", "The admin wants to...", etc. - extract the action
+    for pattern in (_ACTION_RE1, _ACTION_RE2):
+        match = pattern.match(text)
+        if match:
+            groups = match.groups()
+            if len(groups) >= 2:
+                subject = groups[0]
+                action = groups[1]
+                # Create a concise title from subject and action
+                action_short = action[:40].rsplit(' ', 1)[0] if len(action) > 40 else action
+                title = f"{subject.title()} - {action_short}"
+                if len(title) <= max_length:
+                    return title.strip()
+
+    # Try to find the first complete clause (up to a period that's not a number)
+    # Avoid breaking on "1." "2." etc.
+    period_match = _PERIOD_RE.search(text[:max_length])
+    if period_match and period_match.start() > 15:
+        return text[:period_match.start()].strip()
+
+    # Try other natural break points (but not periods after numbers)
+    break_patterns = [', ', ' - ', ': ', '; ', ' so that ', ' in order to ']
+    for pattern in break_patterns:
+        if pattern in text[:max_length].lower():
+            idx = text[:max_length].lower().rfind(pattern)
+            if idx > 15:  # Ensure we have a reasonable length
+                return text[:idx].strip()
+
+    # If no natural break, find the last complete word before max_length
+    if len(text) > max_length:
+        # Find the last space before max_length
+        last_space = text[:max_length].rfind(' ')
+        if last_space > 15:  # Ensure minimum reasonable length
+            return text[:last_space].strip()
+
+    # Fallback: just take first max_length chars and ensure no partial word
+    truncated = text[:max_length]
+    if len(text) > max_length and text[max_length] != ' ':
+        last_space = truncated.rfind(' ')
+        if last_space > 0:
+            truncated = truncated[:last_space]
+
+    return truncated.strip()
+
+
+@lru_cache(maxsize=1024)
+def _extract_key_phrase(text: str) -> str:
+    """Extract a key phrase or subject from text for use as a title."""
+    if not text:
+        return "Untitled"
+
+    # Clean the text
+    text = text.strip()
+    text = _LEADING_MARKER_RE.sub('', text, count=1)  # Remove leading numbers and bullets
+    text = text.strip()
+
+    # Common patterns to extract meaningful titles (compiled case-insensitive).
+    # Skip them when no pattern could match or yield a phrase longer than 5 chars.
+    if len(text) >= 10 and _KEY_PHRASE_TRIGGER_RE.search(text):
+        for pattern, group in _KEY_PHRASE_PATTERNS:
+            match = pattern.search(text)
+            if match:
+                extracted = match.group(group).strip()
+                # Capitalize words
+                if len(extracted) > 5 and len(extracted) < 60:
+                    return extracted.title()
+
+    # Fallback: return first few meaningful words
+    words = text.split()[:6]
+    return ' '.join(words).title() if words else "Untitled"
+
 
 class AIService:
     """Service for AI-powered Scrum assistance."""
 
     def __init__(self, settings: Optional[Settings] = None):
         self.settings = settings or get_settings()
-        self._client: Optional[AsyncOpenAI] = None
-
-    def _get_client(self) -> Optional[AsyncOpenAI]:
-        """Get or create the appropriate AI client."""
-        if self._client is not None:
-            return self._client
+        # Resolve provider and model once; they are read on every completion
+        self._provider = self.settings.ai_provider
+        self._model_name = (
+            self.settings.azure_openai_deployment
+            if self._provider == "azure"
+            else self.settings.openai_model
+        )
+        # Bound in-flight requests and, if configured, throttle to the provider's RPM
+        self._semaphore = asyncio.Semaphore(self.settings.ai_max_concurrency)
+        rpm = self.settings.ai_requests_per_minute
+        self._rate_limiter = AsyncLimiter(rpm, 60) if rpm else nullcontext()
+        # Optional direct aiohttp transport that skips the SDK on the hot path
+        self._use_fast_path = (
+            self.settings.ai_fast_path
+            and self._provider == "openai"
+            and aiohttp is not None
+        )
+        self._http_session: Optional["aiohttp.ClientSession"] = None
 
-        if self.settings.ai_provider == "openai" and self.settings.openai_api_key:
-            self._client = AsyncOpenAI(
+    @cached_property
+    def _client(self) -> Optional[AsyncOpenAI]:
+        """The provider client, created on first use (None when no provider is configured)."""
+        if self._provider == "openai" and self.settings.openai_api_key:
+            return AsyncOpenAI(
                 api_key=self.settings.openai_api_key,
                 base_url=self.settings.openai_base_url,
+                http_client=self._create_http_client(),
             )
-        elif self.settings.ai_provider == "azure" and self.settings.azure_openai_key:
-            self._client = AsyncAzureOpenAI(
+        if self._provider == "azure" and self.settings.azure_openai_key:
+            return AsyncAzureOpenAI(
                 api_key=self.settings.azure_openai_key,
                 azure_endpoint=self.settings.azure_openai_endpoint,
                 api_version=self.settings.azure_openai_api_version,
+                http_client=self._create_http_client(),
             )
+        return None
+
+    def _get_client(self) -> Optional[AsyncOpenAI]:
+        """Get the appropriate AI client."""
         return self._client
 
+    @staticmethod
+    def _create_http_client() -> httpx.AsyncClient:
+        """Create a pooled HTTP/2 client so concurrent completions reuse connections."""
+        return httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+            http2=True,
+            timeout=httpx.Timeout(60.0, connect=5.0),
+        )
+
+    async def close(self):
+        """Close the AI client and its connection pool."""
+        # Drop the cached client so a later call builds a fresh one
+        client = self.__dict__.pop("_client", None)
+        if client is not None:
+            await client.close()
+        if self._http_session is not None:
+            await self._http_session.close()
+            self._http_session = None
+
     def _get_model(self) -> str:
         """Get the appropriate model name based on provider."""
-        if self.settings.ai_provider == "azure":
-            return self.settings.azure_openai_deployment
-        return self.settings.openai_model
+        return self._model_name
+
+    async def _chat_completion(
+        self, messages: List[Dict[str, str]], json_mode: bool = False, **kwargs
+    ) -> str:
+        """Make a chat completion request.
 
-    async def _chat_completion(self, messages: List[Dict[str, str]], **kwargs) -> str:
-        """Make a chat completion request."""
+        With ``json_mode`` the provider is asked for a guaranteed-valid JSON object.
+        """
         client = self._get_client()
         if client is None:
             return self._mock_response(messages)
 
-        response = await client.chat.completions.create(
-            model=self._get_model(),
-            messages=messages,
-            temperature=0.7,
+        if json_mode:
+            kwargs.setdefault("response_format", _JSON_RESPONSE_FORMAT)
+
+        async with self._semaphore, self._rate_limiter:
+            if self._use_fast_path:
+                return await self._fast_chat_completion(messages, **kwargs)
+            response = await client.chat.completions.create(
+                model=self._get_model(),
+                messages=messages,
+                temperature=0.7,
+                **kwargs,
+            )
+        return response.choices[0].message.content or ""
+
+    async def _chat_completion_stream(
+        self, messages: List[Dict[str, str]], json_mode: bool = False, **kwargs
+    ) -> AsyncIterator[str]:
+        """Make a streaming chat completion request, yielding content as it arrives."""
+        client = self._get_client()
+        if client is None:
+            yield self._mock_response(messages)
+            return
+
+        if json_mode:
+            kwargs.setdefault("response_format", _JSON_RESPONSE_FORMAT)
+
+        async with self._semaphore, self._rate_limiter:
+            stream = await client.chat.completions.create(
+                model=self._get_model(),
+                messages=messages,
+                temperature=0.7,
+                stream=True,
+                **kwargs,
+            )
+            async for chunk in stream:
+                # Azure sends content-filter chunks without choices
+                if chunk.choices:
+                    yield chunk.choices[0].delta.content or ""
+
+    def _get_http_session(self) -> "aiohttp.ClientSession":
+        """Get or create the shared aiohttp session used by the fast path."""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=256, ttl_dns_cache=300),
+                headers={"Authorization": f"Bearer {self.settings.openai_api_key}"},
+                timeout=aiohttp.ClientTimeout(total=60, connect=5),
+            )
+        return self._http_session
+
+    async def _fast_chat_completion(self, messages: List[Dict[str, str]], **kwargs) -> str:
+        """Post a chat completion directly to the OpenAI REST endpoint."""
+        session = self._get_http_session()
+        url = f"{self.settings.openai_base_url.rstrip('/')}/chat/completions"
+        payload = {
+            "model": self._get_model(),
+            "messages": messages,
+            "temperature": 0.7,
             **kwargs,
+        }
+        async with session.post(url, json=payload) as response:
+            response.raise_for_status()
+            data = await response.json()
+        return data["choices"][0]["message"]["content"] or ""
+
+    async def batch_chat(self, prompt_list: List[List[Dict[str, str]]], **kwargs) -> List[str]:
+        """Run several chat completions concurrently, returning results in input order."""
+        return await asyncio.gather(
+            *(self._chat_completion(messages, **kwargs) for messages in prompt_list)
         )
-        return response.choices[0].message.content or ""
 
     def _clean_text(self, text: str) -> str:
         """Clean text by removing delimiter characters and formatting artifacts."""
-        if not text:
-            return text
-
-        # Remove common delimiter patterns
-        # Remove lines that are mostly delimiter characters
-        lines = text.split('\n')
-        cleaned_lines = []
-        for line in lines:
-            stripped = line.strip()
-            # Skip lines that are mostly delimiters (=, -, *, #, etc.)
-            if stripped and not re.match(r'^[\s=\-\*#_\|~`]+$', stripped):
-                # Also remove inline delimiter sequences
-                cleaned = re.sub(r'[=]{3,}', '', stripped)
-                cleaned = re.sub(r'[-]{3,}', '', cleaned)
-                cleaned = re.sub(r'[_]{3,}', '', cleaned)
-                cleaned = re.sub(r'[\*]{3,}', '', cleaned)
-                cleaned = re.sub(r'[#]{3,}', '', cleaned)
-                cleaned = re.sub(r'[~]{3,}', '', cleaned)
-                cleaned = re.sub(r'[`]{3,}', '', cleaned)
-                cleaned = re.sub(r'[\|]{3,}', '', cleaned)
-                cleaned = cleaned.strip()
-                if cleaned:
-                    cleaned_lines.append(cleaned)
-
-        return '\n'.join(cleaned_lines)
+        return _clean_text(text)
 
     def _mock_response(self, messages: List[Dict[str, str]]) -> str:
         """Generate mock response when no AI provider is configured.
@@ -111,7 +381,7 @@ class AIService:
             return self._generate_stories_mock(user_message)
         else:
             # Default fallback
-            return json.dumps({
+            return orjson.dumps({
                 "tasks": [
                     {
                         "title": "Analyze requirements",
@@ -123,156 +393,48 @@ class AIService:
                 ],
                 "total_estimated_hours": 2,
                 "recommendations": ["Review requirements carefully before implementation"]
-            })
+            }).decode()
 
     def _create_short_title(self, text: str, max_length: int = 60) -> str:
         """Create a short, complete title from text without cutting words mid-sentence."""
-        if not text:
-            return "Untitled Task"
-
-        # Clean the text first
-        text = text.strip()
-
-        # Remove leading numbers/bullets (e.g., "1. ", "2. ", "- ", "* ")
-        text = re.sub(r'^[\d]+\.\s*', '', text)
-        text = re.sub(r'^[-\*•]\s*', '', text)
-        text = text.strip()
-
-        # If already short enough, return as is
-        if len(text) <= max_length:
-            return text
-
-        # Extract the key action/subject from the text
-        # Look for common patterns and extract meaningful phrases
-
-        # If text starts with common phrases, try to extract the main subject
-        lower_text = text.lower()
-
-        # For "Users need to...", "The admin wants to...", etc. - extract the action
-        action_patterns = [
-            r'^(?:the\s+)?(\w+(?:\s+\w+)?)\s+(?:need|want|should|must|can|will)\s+(?:to\s+)?(.+)',
-            r'^(?:we\s+)?(?:need|want|should|must)\s+(?:to\s+)?(.+)',
-        ]
-
-        for pattern in action_patterns:
-            match = re.match(pattern, text, re.IGNORECASE)
-            if match:
-                groups = match.groups()
-                if len(groups) >= 2:
-                    subject = groups[0]
-                    action = groups[1]
-                    # Create a concise title from subject and action
-                    action_short = action[:40].rsplit(' ', 1)[0] if len(action) > 40 else action
-                    title = f"{subject.title()} - {action_short}"
-                    if len(title) <= max_length:
-                        return title.strip()
-
-        # Try to find the first complete clause (up to a period that's not a number)
-        # Avoid breaking on "1." "2." etc.
-        period_match = re.search(r'(?<!\d)\.\s', text[:max_length])
-        if period_match and period_match.start() > 15:
-            return text[:period_match.start()].strip()
-
-        # Try other natural break points (but not periods after numbers)
-        break_patterns = [', ', ' - ', ': ', '; ', ' so that ', ' in order to ']
-        for pattern in break_patterns:
-            if pattern in text[:max_length].lower():
-                idx = text[:max_length].lower().rfind(pattern)
-                if idx > 15:  # Ensure we have a reasonable length
-                    return text[:idx].strip()
-
-        # If no natural break, find the last complete word before max_length
-        if len(text) > max_length:
-            # Find the last space before max_length
-            last_space = text[:max_length].rfind(' ')
-            if last_space > 15:  # Ensure minimum reasonable length
-                return text[:last_space].strip()
-
-        # Fallback: just take first max_length chars and ensure no partial word
-        truncated = text[:max_length]
-        if len(text) > max_length and text[max_length] != ' ':
-            last_space = truncated.rfind(' ')
-            if last_space > 0:
-                truncated = truncated[:last_space]
-
-        return truncated.strip()
+        return _create_short_title(text, max_length)
 
     def _extract_key_phrase(self, text: str) -> str:
         """Extract a key phrase or subject from text for use as a title."""
-        if not text:
-            return "Untitled"
-
-        # Clean the text
-        text = text.strip()
-        text = re.sub(r'^[\d]+\.\s*', '', text)  # Remove leading numbers
-        text = re.sub(r'^[-\*•]\s*', '', text)   # Remove bullets
-        text = text.strip()
-
-        # Try to extract the main subject/action
-        lower = text.lower()
-
-        # Common patterns to extract meaningful titles
-        patterns = [
-            # "Users need password reset" -> "Password Reset"
-            (r'(?:need|want|require)s?\s+(?:a\s+|the\s+)?(.+?)(?:\s+so\s+that|\s+in\s+order\s+to|$)', 1),
-            # "implement two-factor authentication" -> "Two-Factor Authentication"
-            (r'(?:implement|create|build|add|develop)\s+(?:a\s+|the\s+)?(.+?)(?:\s+so\s+that|\s+in\s+order\s+to|$)', 1),
-            # "ability to view all users" -> "View All Users"
-            (r'ability\s+to\s+(.+?)(?:\s+so\s+that|\s+in\s+order\s+to|$)', 1),
-            # "be able to reset password" -> "Reset Password"
-            (r'be\s+able\s+to\s+(.+?)(?:\s+so\s+that|\s+in\s+order\s+to|$)', 1),
-        ]
-
-        for pattern, group in patterns:
-            match = re.search(pattern, lower)
-            if match:
-                extracted = match.group(group).strip()
-                # Capitalize words
-                if len(extracted) > 5 and len(extracted) < 60:
-                    return extracted.title()
-
-        # Fallback: return first few meaningful words
-        words = text.split()[:6]
-        return ' '.join(words).title() if words else "Untitled"
+        return _extract_key_phrase(text)
 
     def _generate_standup_mock(self, user_message: str) -> str:
         """Generate mock standup summary based on actual input content."""
-        lines = user_message.split('\n')
-
-        # Extract names and work items from the standup entries
+        # Extract names and work items from the standup entries in a single scan
         names = []
         yesterday_items = []
         today_items = []
         blockers = []
 
-        for line in lines:
-            if '**' in line and '**:' in line:
-                # Extract name
-                name = line.split('**')[1] if '**' in line else ""
-                if name:
-                    names.append(name)
-            elif '- Yesterday:' in line:
-                item = line.replace('- Yesterday:', '').strip()
-                if item:
-                    yesterday_items.append(item)
-            elif '- Today:' in line:
-                item = line.replace('- Today:', '').strip()
-                if item:
-                    today_items.append(item)
-            elif '- Blockers:' in line:
-                item = line.replace('- Blockers:', '').strip()
-                if item and item.lower() != 'none':
-                    blockers.append(item)
+        for match in _STANDUP_LINE_RE.finditer(user_message):
+            kind = match.lastgroup
+            item = match.group(kind).strip()
+            if not item:
+                continue
+            if kind == 'name':
+                names.append(item)
+            elif kind == 'yesterday':
+                yesterday_items.append(item)
+            elif kind == 'today':
+                today_items.append(item)
+            elif item.lower() != 'none':
+                blockers.append(item)
 
         # Generate summary based on actual content
         team_size = len(names) if names else 1
-        summary = f"Team of {team_size} members reported progress. "
+        summary_parts = [f"Team of {team_size} members reported progress. "]
         if yesterday_items:
-            summary += f"Yesterday's focus included: {self._create_short_title(yesterday_items[0], 80)}. "
+            summary_parts.append(f"Yesterday's focus included: {self._create_short_title(yesterday_items[0], 80)}. ")
         if today_items:
-            summary += f"Today's priorities include: {self._create_short_title(today_items[0], 80)}. "
+            summary_parts.append(f"Today's priorities include: {self._create_short_title(today_items[0], 80)}. ")
         if blockers:
-            summary += f"There are {len(blockers)} blocker(s) requiring attention."
+            summary_parts.append(f"There are {len(blockers)} blocker(s) requiring attention.")
+        summary = "".join(summary_parts)
 
         # Generate tasks from today's work items
         suggested_tasks = []
@@ -315,7 +477,7 @@ class AIService:
                     "story_points": 5
                 })
 
-        return json.dumps({
+        return orjson.dumps({
             "summary": summary,
             "key_blockers": blockers[:5] if blockers else ["No critical blockers reported"],
             "action_items": [f"Follow up on: {self._create_short_title(item, 50)}" for item in today_items[:3]] or ["Review team progress"],
@@ -336,7 +498,7 @@ class AIService:
                     "story_points": 2
                 }
             ]
-        })
+        }).decode()
 
     def _generate_tasks_mock(self, user_message: str) -> str:
         """Generate mock sprint tasks based on actual user stories input."""
@@ -352,33 +514,29 @@ class AIService:
             elif len(line) > 20:  # Any substantial line could be a story
                 stories.append(line)
 
-        # Generate tasks from the actual stories
+        # Generate tasks from the actual stories (limit to 10 stories)
+        titles = [self._create_short_title(story, 50) for story in stories[:10]]
+        priorities = ["high"] * 3 + ["medium"] * 7
         tasks = []
-        total_hours = 0
-
-        for i, story in enumerate(stories[:10]):  # Limit to 10 stories
-            # Create short title for the story
-            story_title = self._create_short_title(story, 50)
-
-            # Design task
-            tasks.append({
-                "title": f"Design: {story_title}",
-                "description": f"Create design and technical specification for: {story}",
-                "estimated_hours": 3,
-                "priority": "high" if i < 3 else "medium",
-                "parent_story": story_title
-            })
-            total_hours += 3
-
-            # Implementation task
-            tasks.append({
-                "title": f"Implement: {story_title}",
-                "description": f"Develop and implement the functionality for: {story}",
-                "estimated_hours": 6,
-                "priority": "high" if i < 3 else "medium",
-                "parent_story": story_title
-            })
-            total_hours += 6
+
+        for i, (story, story_title) in enumerate(zip(stories, titles)):
+            priority = priorities[i]
+            tasks.extend((
+                {
+                    "title": f"Design: {story_title}",
+                    "description": f"Create design and technical specification for: {story}",
+                    "estimated_hours": 3,
+                    "priority": priority,
+                    "parent_story": story_title
+                },
+                {
+                    "title": f"Implement: {story_title}",
+                    "description": f"Develop and implement the functionality for: {story}",
+                    "estimated_hours": 6,
+                    "priority": priority,
+                    "parent_story": story_title
+                },
+            ))
 
             # Testing task (for first 5 stories)
             if i < 5:
@@ -389,7 +547,9 @@ class AIService:
                     "priority": "medium",
                     "parent_story": story_title
                 })
-                total_hours += 2
+
+        # 3h design + 6h implementation per story, plus 2h testing for the first 5
+        total_hours = 9 * len(titles) + 2 * min(5, len(titles))
 
         recommendations = []
         if len(stories) > 5:
@@ -398,7 +558,7 @@ class AIService:
             recommendations.append(f"Total estimated hours ({total_hours}h) may exceed sprint capacity")
         recommendations.append("Prioritize stories based on business value and dependencies")
 
-        return json.dumps({
+        return orjson.dumps({
             "tasks": tasks if tasks else [
                 {
                     "title": "Analyze requirements",
@@ -410,7 +570,7 @@ class AIService:
             ],
             "total_estimated_hours": total_hours if total_hours > 0 else 2,
             "recommendations": recommendations
-        })
+        }).decode()
 
     def _generate_stories_mock(self, user_message: str) -> str:
         """Generate mock user stories based on actual meeting notes input."""
@@ -418,21 +578,18 @@ class AIService:
         lines = user_message.split('\n')
 
         # Look for actionable items in the text
-        keywords = ['need', 'want', 'should', 'must', 'require', 'feature', 'user', 'admin', 'customer', 'ability']
         relevant_lines = []
 
         for line in lines:
             line = line.strip()
             # Remove leading numbers and bullets
-            line = re.sub(r'^[\d]+\.\s*', '', line)
-            line = re.sub(r'^[-\*•]\s*', '', line)
+            line = _LEADING_MARKER_RE.sub('', line, count=1)
             line = line.strip()
 
             if not line:
                 continue
 
-            line_lower = line.lower()
-            if any(keyword in line_lower for keyword in keywords):
+            if _KEYWORD_RE.search(line):
                 relevant_lines.append(line)
             elif len(line) > 50:  # Substantial content
                 relevant_lines.append(line)
@@ -441,12 +598,13 @@ class AIService:
         stories = []
         for i, line in enumerate(relevant_lines[:8]):  # Limit to 8 stories
             # Determine the role based on content
+            line_lower = line.lower()
             role = "user"
-            if 'admin' in line.lower():
+            if 'admin' in line_lower:
                 role = "admin"
-            elif 'customer' in line.lower():
+            elif 'customer' in line_lower:
                 role = "customer"
-            elif 'manager' in line.lower():
+            elif 'manager' in line_lower:
                 role = "manager"
 
             # Create a meaningful title from the line
@@ -455,9 +613,8 @@ class AIService:
                 feature_title = self._create_short_title(feature_title, 45)
 
             # Clean the description - extract the core requirement
-            description_text = line.lower()
             # Remove redundant phrases
-            description_text = re.sub(r'^(?:the\s+)?(?:admin|user|customer|manager)\s+(?:team\s+)?(?:wants?\s+to\s+|needs?\s+to\s+)?', '', description_text)
+            description_text = _ROLE_PREFIX_RE.sub('', line_lower)
             description_text = description_text.strip()
 
             if len(description_text) > 120:
@@ -489,17 +646,17 @@ class AIService:
                 "story_points": 5
             })
 
-        return json.dumps({
+        return orjson.dumps({
             "stories": stories,
             "raw_insights": f"Analyzed {len(relevant_lines)} relevant items from the meeting notes. Generated {len(stories)} user stories based on the content provided."
-        })
+        }).decode()
 
-    async def summarize_standup(
+    def _build_standup_messages(
         self, entries: List[StandupEntry], sprint_goal: Optional[str] = None
-    ) -> StandupSummaryResponse:
-        """Summarize standup entries into actionable insights."""
+    ) -> List[Dict[str, str]]:
+        """Build the chat messages for a standup summary request."""
         entries_text = "\n".join(
-            f"**{e.name}**:\n- Yesterday: {e.yesterday}\n- Today: {e.today}\n- Blockers: {e.blockers or 'None'}"
+            _STANDUP_ENTRY_TEMPLATE.format_map({**e.model_dump(), "blockers": e.blockers or "None"})
             for e in entries
         )
 
@@ -536,21 +693,24 @@ Respond in JSON format:
 
         user_prompt = f"Sprint Goal: {sprint_goal or 'Not specified'}\n\nStandup Entries:\n{entries_text}"
 
-        response = await self._chat_completion([
+        return [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt},
-        ])
+        ]
+
+    async def summarize_standup(
+        self, entries: List[StandupEntry], sprint_goal: Optional[str] = None
+    ) -> StandupSummaryResponse:
+        """Summarize standup entries into actionable insights."""
+        response = await self._chat_completion(
+            self._build_standup_messages(entries, sprint_goal), json_mode=True
+        )
 
         try:
-            data = json.loads(response)
-            # Convert nested dicts to proper model instances
-            if "suggested_tasks" in data:
-                data["suggested_tasks"] = [SprintTask(**t) for t in data["suggested_tasks"]]
-            if "suggested_stories" in data:
-                data["suggested_stories"] = [UserStory(**s) for s in data["suggested_stories"]]
-            return StandupSummaryResponse(**data)
-        except (json.JSONDecodeError, ValueError) as e:
-            print(f"[Standup] Error parsing response: {e}")
+            # Parse and validate nested tasks/stories in one pass
+            return StandupSummaryResponse.model_validate_json(response)
+        except ValueError as e:
+            logger.warning("[Standup] Error parsing response: %s", e)
             return StandupSummaryResponse(
                 summary=response,
                 key_blockers=[],
@@ -559,6 +719,15 @@ Respond in JSON format:
                 suggested_stories=[],
             )
 
+    async def summarize_standup_stream(
+        self, entries: List[StandupEntry], sprint_goal: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """Stream the raw JSON standup summary as the model generates it."""
+        async for chunk in self._chat_completion_stream(
+            self._build_standup_messages(entries, sprint_goal), json_mode=True
+        ):
+            yield chunk
+
     async def generate_user_stories(
         self, notes: str, context: Optional[str] = None
     ) -> UserStoriesResponse:
@@ -584,12 +753,11 @@ Respond in JSON format:
         response = await self._chat_completion([
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt},
-        ])
+        ], json_mode=True)
 
         try:
-            data = json.loads(response)
-            return UserStoriesResponse(**data)
-        except (json.JSONDecodeError, ValueError):
+            return UserStoriesResponse.model_validate_json(response)
+        except ValueError:
             return UserStoriesResponse(
                 stories=[
                     UserStory(
@@ -601,13 +769,29 @@ Respond in JSON format:
                 raw_insights=None,
             )
 
-    async def suggest_sprint_tasks(
+    async def stream_user_stories(
+        self, notes_iter: Iterable[str], context: Optional[str] = None
+    ) -> AsyncIterator[UserStoriesResponse]:
+        """Generate stories for many sets of notes, yielding each result as it completes."""
+        tasks = [
+            asyncio.create_task(self.generate_user_stories(notes, context))
+            for notes in notes_iter
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Consumer stopped early: don't leave orphaned requests running
+            for task in tasks:
+                task.cancel()
+
+    def _build_tasks_messages(
         self,
         user_stories: List[str],
         team_capacity: Optional[int] = None,
         sprint_duration_days: int = 14,
-    ) -> SprintTasksResponse:
-        """Suggest sprint tasks based on user stories."""
+    ) -> List[Dict[str, str]]:
+        """Build the chat messages for a sprint task breakdown request."""
         system_prompt = f"""You are a technical lead. Break down user stories into actionable sprint tasks.
 Consider a {sprint_duration_days}-day sprint{f' with {team_capacity} story points capacity' if team_capacity else ''}.
 
@@ -629,15 +813,16 @@ Respond in JSON format:
         stories_text = "\n".join(f"- {story}" for story in user_stories)
         user_prompt = f"User Stories:\n{stories_text}"
 
-        response = await self._chat_completion([
+        return [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt},
-        ])
+        ]
 
+    def _parse_tasks_response(self, response: str) -> SprintTasksResponse:
+        """Parse a sprint task breakdown response, falling back to a planning task."""
         try:
-            data = json.loads(response)
-            return SprintTasksResponse(**data)
-        except (json.JSONDecodeError, ValueError):
+            result = SprintTasksResponse.model_validate_json(response)
+        except ValueError:
             return SprintTasksResponse(
                 tasks=[
                     SprintTask(
@@ -651,14 +836,118 @@ Respond in JSON format:
                 recommendations=["Manual task breakdown recommended"],
             )
 
+        # Models often mis-add, so total the estimates locally when every task has one
+        hours = [task.estimated_hours for task in result.tasks]
+        if hours and None not in hours:
+            result.total_estimated_hours = math.fsum(hours)
+        return result
 
-# Singleton instance
-_ai_service: Optional[AIService] = None
+    async def suggest_sprint_tasks(
+        self,
+        user_stories: List[str],
+        team_capacity: Optional[int] = None,
+        sprint_duration_days: int = 14,
+    ) -> SprintTasksResponse:
+        """Suggest sprint tasks based on user stories."""
+        response = await self._chat_completion(
+            self._build_tasks_messages(user_stories, team_capacity, sprint_duration_days),
+            json_mode=True,
+        )
+        return self._parse_tasks_response(response)
+
+    # ------------------------------------------------------------------
+    # Batch API (bulk, non-interactive workloads)
+    # ------------------------------------------------------------------
+
+    async def submit_batch(self, requests: List[List[Dict[str, str]]], **kwargs) -> str:
+        """Upload chat requests as an OpenAI Batch API job and return the batch ID."""
+        client = self._get_client()
+        if client is None:
+            raise RuntimeError("The Batch API requires a configured AI provider")
+
+        lines = [
+            orjson.dumps({
+                "custom_id": f"request-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self._get_model(),
+                    "messages": messages,
+                    "temperature": 0.7,
+                    **kwargs,
+                },
+            })
+            for i, messages in enumerate(requests)
+        ]
+        input_file = await client.files.create(
+            file=("batch.jsonl", b"\n".join(lines)),
+            purpose="batch",
+        )
+        batch = await client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        return batch.id
+
+    async def wait_for_batch(self, batch_id: str, poll_interval: float = 30.0) -> List[str]:
+        """Poll a batch until it finishes and return the responses in request order."""
+        client = self._get_client()
+        if client is None:
+            raise RuntimeError("The Batch API requires a configured AI provider")
+
+        while True:
+            batch = await client.batches.retrieve(batch_id)
+            if batch.status == "completed":
+                break
+            if batch.status in ("failed", "expired", "cancelled"):
+                raise RuntimeError(f"Batch {batch_id} ended with status '{batch.status}'")
+            await asyncio.sleep(poll_interval)
+
+        results: Dict[int, str] = {}
+        if batch.output_file_id:
+            output = await client.files.content(batch.output_file_id)
+            for line in output.text.splitlines():
+                if not line.strip():
+                    continue
+                record = orjson.loads(line)
+                index = int(record["custom_id"].rsplit("-", 1)[1])
+                body = (record.get("response") or {}).get("body") or {}
+                choices = body.get("choices") or [{}]
+                results[index] = choices[0].get("message", {}).get("content") or ""
+
+        # Requests that errored have no output line; they parse to the fallback
+        total = batch.request_counts.total if batch.request_counts else len(results)
+        return [results.get(i, "") for i in range(total)]
+
+    async def suggest_sprint_tasks_batch(
+        self,
+        list_of_story_lists: List[List[str]],
+        team_capacity: Optional[int] = None,
+        sprint_duration_days: int = 14,
+    ) -> List[SprintTasksResponse]:
+        """Suggest sprint tasks for many story lists through the Batch API.
+
+        Falls back to concurrent regular requests when no AI provider is configured.
+        """
+        if self._get_client() is None:
+            return await asyncio.gather(*(
+                self.suggest_sprint_tasks(stories, team_capacity, sprint_duration_days)
+                for stories in list_of_story_lists
+            ))
+
+        batch_id = await self.submit_batch(
+            [
+                self._build_tasks_messages(stories, team_capacity, sprint_duration_days)
+                for stories in list_of_story_lists
+            ],
+            response_format=_JSON_RESPONSE_FORMAT,
+        )
+        responses = await self.wait_for_batch(batch_id)
+        return [self._parse_tasks_response(response) for response in responses]
 
 
+@lru_cache(maxsize=1)
 def get_ai_service() -> AIService:
     """Get or create the AI service singleton."""
-    global _ai_service
-    if _ai_service is None:
-        _ai_service = AIService()
-    return _ai_service
+    return AIService()
@@ -24,9 +24,13 @@ class Settings(BaseSettings):
     # Application
     app_name: str = "AI Sprint Companion"
     debug: bool = False
+    max_upload_bytes: int = 25 * 1024 * 1024  # Larger request bodies are rejected with 413
 
     # AI Provider Configuration
     ai_provider: Literal["openai", "azure", "mock"] = "mock"
+    ai_max_concurrency: int = 50  # Max in-flight chat completion requests
+    ai_requests_per_minute: Optional[int] = None  # Provider RPM limit, unthrottled if unset
+    ai_fast_path: bool = False  # Call the OpenAI REST API directly via aiohttp
 
     # OpenAI Configuration
     openai_api_key: Optional[str] = None
@@ -47,6 +51,9 @@ class Settings(BaseSettings):
     jira_email: Optional[str] = None
     jira_api_token: Optional[str] = None
     jira_project_key: Optional[str] = None  # e.g., PROJ
+    jira_max_concurrency: int = 8  # Max in-flight bulk ticket creates (Jira rate-limits aggressively)
+    jira_interactive_concurrency: int = 10  # Max in-flight single-ticket creates, separate from bulk
+    jira_bulk_requests_per_minute: int = 30  # Bulk create requests allowed per client IP
 
 
 @lru_cache
@@ -1,9 +1,93 @@
 """Document parsing utilities for extracting text from various file formats."""
+import asyncio
 import io
+import logging
+import os
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional
 
 from fastapi import UploadFile
 
+from .config import get_settings
+
+try:
+    from charset_normalizer import from_bytes as detect_charset
+except ImportError:  # Optional: falls back to trying encodings in turn
+    detect_charset = None
+
+try:
+    import pymupdf
+except ImportError:  # Optional: falls back to PyPDF2
+    pymupdf = None
+
+try:
+    from PyPDF2 import PdfReader
+except ImportError:
+    PdfReader = None
+
+try:
+    from docx import Document
+except ImportError:
+    Document = None
+
+logger = logging.getLogger(__name__)
+
+# Leading signature bytes -> parser (docx is a ZIP container, doc is OLE2)
+# Only used to correct an upload whose extension is already supported
+_MAGIC_FORMATS = {
+    b'%PDF': 'pdf',
+    b'PK\x03\x04': 'docx',
+    b'\xd0\xcf\x11\xe0': 'doc',
+}
+_EXTENSION_FORMATS = {
+    '.txt': 'txt',
+    '.pdf': 'pdf',
+    '.docx': 'docx',
+    '.doc': 'doc',
+}
+
+# PDFs with at least this many pages are split across the worker pool
+_PARALLEL_PDF_MIN_PAGES = 8
+_PDF_WORKERS = os.cpu_count() or 1
+
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+
+# Leading bytes of a .doc checked for readable text before filtering the whole file
+_DOC_SNIFF_BYTES = 8192
+# ASCII control bytes (except tab/newline/carriage return) dropped from .doc content
+_DOC_CONTROL_BYTES = bytes(b for b in range(128) if not chr(b).isprintable() and chr(b) not in '\n\r\t')
+
+
+# ZIP member that marks a ZIP container as a Word document (xlsx/pptx/zip lack it)
+_DOCX_MARKER = 'word/document.xml'
+
+
+def _is_docx_container(content: bytes) -> bool:
+    """Check that a ZIP upload is a Word document rather than any other ZIP."""
+    try:
+        with zipfile.ZipFile(io.BytesIO(content)) as archive:
+            return _DOCX_MARKER in archive.namelist()
+    except zipfile.BadZipFile:
+        return False
+
+
+def _detect_format(content: bytes, filename: str) -> Optional[str]:
+    """
+    Identify the parser for an upload from its extension, corrected by its magic bytes.
+
+    Unsupported extensions are rejected whatever the content, so spreadsheets,
+    slide decks and plain archives never reach the document parsers.
+    """
+    extension_format = _EXTENSION_FORMATS.get(os.path.splitext(filename)[1])
+    if extension_format is None:
+        return None
+
+    magic_format = _MAGIC_FORMATS.get(content[:4])
+    if magic_format == 'docx' and not _is_docx_container(content):
+        magic_format = None
+    return magic_format or extension_format
+
 
 async def extract_text_from_file(file: UploadFile) -> Optional[str]:
     """
@@ -16,41 +100,58 @@ async def extract_text_from_file(file: UploadFile) -> Optional[str]:
 
     filename = file.filename.lower()
 
-    # Read content and reset file pointer
-    content = await file.read()
-    await file.seek(0)  # Reset file pointer for potential re-reads
+    # Read at most one byte past the limit so oversize uploads never land in memory whole
+    max_bytes = get_settings().max_upload_bytes
+    content = await file.read(max_bytes + 1)
+    if len(content) > max_bytes:
+        logger.warning("Upload %s exceeds %d bytes", filename, max_bytes)
+        return None
 
     if not content:
-        print(f"Warning: Empty file content for {filename}")
+        logger.warning("Empty file content for %s", filename)
         return None
 
-    print(f"Processing file: {filename}, size: {len(content)} bytes")
+    logger.debug("Processing file: %s, size: %d bytes", filename, len(content))
+
+    file_format = _detect_format(content, filename)
+    if file_format is None:
+        logger.warning("Unsupported file format: %s", filename)
+        return None
 
     try:
-        if filename.endswith('.txt'):
-            result = extract_from_txt(content)
-        elif filename.endswith('.pdf'):
-            result = extract_from_pdf(content)
-        elif filename.endswith('.docx'):
-            result = extract_from_docx(content)
-        elif filename.endswith('.doc'):
-            result = extract_from_doc(content)
+        # Parsers are CPU-bound (charset detection included), so keep them off the event loop
+        if file_format == 'txt':
+            result = await asyncio.to_thread(extract_from_txt, content)
+        elif file_format == 'pdf':
+            result = await extract_from_pdf_async(content)
+        elif file_format == 'docx':
+            result = await asyncio.to_thread(extract_from_docx, content)
         else:
-            print(f"Unsupported file format: {filename}")
-            return None
+            result = await asyncio.to_thread(extract_from_doc, content)
 
         if result:
-            print(f"Extracted {len(result)} characters from {filename}")
+            logger.debug("Extracted %d characters from %s", len(result), filename)
         return result
     except Exception as e:
-        print(f"Error extracting text from {filename}: {e}")
+        logger.warning("Error extracting text from %s: %s", filename, e)
         return None
 
 
 def extract_from_txt(content: bytes) -> str:
     """Extract text from .txt file."""
+    # Most uploads are UTF-8, so try that before running detection
+    try:
+        return content.decode('utf-8')
+    except UnicodeDecodeError:
+        pass
+
+    if detect_charset is not None:
+        best = detect_charset(content).best()
+        if best is not None:
+            return str(best)
+
     # Try different encodings
-    for encoding in ['utf-8', 'utf-16', 'latin-1', 'cp1252']:
+    for encoding in ['utf-16', 'latin-1', 'cp1252']:
         try:
             return content.decode(encoding)
         except UnicodeDecodeError:
@@ -59,10 +160,104 @@ def extract_from_txt(content: bytes) -> str:
 
 
 def extract_from_pdf(content: bytes) -> str:
-    """Extract text from .pdf file."""
+    """Extract text from .pdf file (PyMuPDF when installed, PyPDF2 otherwise)."""
+    if pymupdf is None:
+        return _extract_from_pdf_pypdf2(content)
+
     try:
-        from PyPDF2 import PdfReader
+        text_parts = []
+        with pymupdf.open(stream=content, filetype="pdf") as doc:
+            for page in doc:
+                text = page.get_text("text")
+                if text:
+                    text_parts.append(text)
 
+        return '\n'.join(text_parts)
+    except Exception as e:
+        return f"[Error reading PDF: {str(e)}]"
+
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    """Get the shared PDF worker pool, created on first use."""
+    global _pdf_pool
+    if _pdf_pool is None:
+        _pdf_pool = ProcessPoolExecutor(max_workers=_PDF_WORKERS)
+    return _pdf_pool
+
+
+def shutdown_pdf_pool() -> None:
+    """Shut down the PDF worker pool if it was started."""
+    global _pdf_pool
+    if _pdf_pool is not None:
+        _pdf_pool.shutdown(wait=False, cancel_futures=True)
+        _pdf_pool = None
+
+
+def _pdf_page_count(content: bytes) -> int:
+    """Count PDF pages with PyMuPDF (0 when unavailable or unreadable)."""
+    if pymupdf is None:
+        return 0
+
+    try:
+        with pymupdf.open(stream=content, filetype="pdf") as doc:
+            return doc.page_count
+    except Exception:
+        return 0
+
+
+def _extract_pdf_page_range(content: bytes, start: int, stop: int) -> str:
+    """Extract text from pages [start, stop) of a PDF (runs in a worker process)."""
+    text_parts = []
+    with pymupdf.open(stream=content, filetype="pdf") as doc:
+        for page in doc.pages(start, stop):
+            text = page.get_text("text")
+            if text:
+                text_parts.append(text)
+
+    return '\n'.join(text_parts)
+
+
+async def extract_from_pdf_async(content: bytes) -> str:
+    """
+    Extract text from .pdf file without blocking the event loop.
+
+    Large PDFs are split into one contiguous page range per worker process and
+    small PDFs are parsed in a single thread. PyPDF2 is pure Python and would hold
+    the GIL for the whole parse, so PyPDF2-only installs parse in one worker process.
+    """
+    loop = asyncio.get_running_loop()
+    if pymupdf is None and PdfReader is not None:
+        try:
+            return await loop.run_in_executor(_get_pdf_pool(), _extract_from_pdf_pypdf2, content)
+        except Exception as e:
+            return f"[Error reading PDF: {str(e)}]"
+
+    page_count = await asyncio.to_thread(_pdf_page_count, content)
+    if page_count < _PARALLEL_PDF_MIN_PAGES:
+        return await asyncio.to_thread(extract_from_pdf, content)
+
+    pool = _get_pdf_pool()
+    chunk_size = -(-page_count // _PDF_WORKERS)
+    try:
+        # gather preserves submission order, so ranges come back in page order
+        parts = await asyncio.gather(*(
+            loop.run_in_executor(
+                pool, _extract_pdf_page_range, content, start, min(start + chunk_size, page_count)
+            )
+            for start in range(0, page_count, chunk_size)
+        ))
+    except Exception as e:
+        return f"[Error reading PDF: {str(e)}]"
+
+    return '\n'.join(part for part in parts if part)
+
+
+def _extract_from_pdf_pypdf2(content: bytes) -> str:
+    """Extract text from .pdf file with the pure-Python PyPDF2 reader."""
+    if PdfReader is None:
+        return "[PDF parsing requires PyMuPDF or PyPDF2. Please install it with: pip install PyMuPDF]"
+
+    try:
         pdf_file = io.BytesIO(content)
         reader = PdfReader(pdf_file)
 
@@ -73,17 +268,16 @@ def extract_from_pdf(content: bytes) -> str:
                 text_parts.append(text)
 
         return '\n'.join(text_parts)
-    except ImportError:
-        return "[PDF parsing requires PyPDF2. Please install it with: pip install PyPDF2]"
     except Exception as e:
         return f"[Error reading PDF: {str(e)}]"
 
 
 def extract_from_docx(content: bytes) -> str:
     """Extract text from .docx file."""
-    try:
-        from docx import Document
+    if Document is None:
+        return "[DOCX parsing requires python-docx. Please install it with: pip install python-docx]"
 
+    try:
         docx_file = io.BytesIO(content)
         doc = Document(docx_file)
 
@@ -100,8 +294,6 @@ def extract_from_docx(content: bytes) -> str:
                     text_parts.append(row_text)
 
         return '\n'.join(text_parts)
-    except ImportError:
-        return "[DOCX parsing requires python-docx. Please install it with: pip install python-docx]"
     except Exception as e:
         return f"[Error reading DOCX: {str(e)}]"
 
@@ -113,9 +305,12 @@ def extract_from_doc(content: bytes) -> str:
     """
     # Try to extract as plain text (works for some .doc files)
     try:
-        text = content.decode('utf-8', errors='ignore')
-        # Filter out binary garbage
-        printable_text = ''.join(char for char in text if char.isprintable() or char in '\n\r\t')
+        # Sniff a prefix first so mostly-binary files are never decoded in full
+        sample = content[:_DOC_SNIFF_BYTES]
+        printable_text = sample.translate(None, _DOC_CONTROL_BYTES).decode('utf-8', errors='ignore')
+        if len(printable_text) > 50 and len(content) > len(sample):
+            # Filter out binary garbage in one pass over the raw bytes
+            printable_text = content.translate(None, _DOC_CONTROL_BYTES).decode('utf-8', errors='ignore')
         if len(printable_text) > 50:  # If we got meaningful text
             return printable_text
     except:
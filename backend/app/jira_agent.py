@@ -13,15 +13,50 @@ To use this integration:
    - JIRA_PROJECT_KEY: The project key where tickets will be created (e.g., PROJ)
 """
 
-import json
-from typing import Any, Dict, List, Optional
+import asyncio
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 import httpx
+import orjson
 
 from .config import get_settings
 
 
+# Issue type name -> id maps shared by all agents, keyed by (jira_url, project_key)
+_ISSUE_TYPES_TTL_SECONDS = 3600
+_issue_types_cache: Dict[Tuple[str, str], Tuple[float, Dict[str, str]]] = {}
+
+# Max issues Jira accepts in one POST /issue/bulk request
+_BULK_CREATE_LIMIT = 50
+
+
+def _make_heading(level: int) -> Callable[[str], Dict[str, Any]]:
+    """Build an ADF heading node factory for a "hN. " prefixed line."""
+    def make(para: str) -> Dict[str, Any]:
+        return {
+            "type": "heading",
+            "attrs": {"level": level},
+            "content": [{"type": "text", "text": para[4:]}]
+        }
+    return make
+
+
+def _make_rule(para: str) -> Dict[str, Any]:
+    """Build an ADF horizontal rule node."""
+    return {"type": "rule"}
+
+
+# Description line prefix -> ADF node factory, looked up on the first 4 chars
+_PREFIX_HANDLERS: Dict[str, Callable[[str], Dict[str, Any]]] = {
+    'h3. ': _make_heading(3),
+    'h2. ': _make_heading(2),
+    '----': _make_rule,
+}
+
+
 class JiraIssueType(str, Enum):
     """Jira issue types."""
     STORY = "Story"
@@ -77,8 +112,13 @@ class JiraAgent:
         self.project_key = project_key or getattr(settings, 'jira_project_key', None)
 
         self._client: Optional[httpx.AsyncClient] = None
+        self._project: Optional[Dict[str, Any]] = None
         self._project_id: Optional[str] = None
         self._issue_types: Dict[str, str] = {}
+        # Separate caps for single-ticket and bulk creates, so a burst of bulk
+        # work cannot take every connection from interactive requests
+        self._interactive_semaphore = asyncio.Semaphore(settings.jira_interactive_concurrency)
+        self._bulk_semaphore = asyncio.Semaphore(settings.jira_max_concurrency)
 
     @property
     def is_configured(self) -> bool:
@@ -100,6 +140,13 @@ class JiraAgent:
                     "Content-Type": "application/json",
                 },
                 timeout=30.0,
+                # Multiplex concurrent batch creates over pooled HTTP/2 connections
+                http2=True,
+                limits=httpx.Limits(
+                    max_keepalive_connections=16,
+                    max_connections=32,
+                    keepalive_expiry=60,
+                ),
             )
         return self._client
 
@@ -126,7 +173,7 @@ class JiraAgent:
         return response.json()
 
     async def get_project(self) -> Dict[str, Any]:
-        """Get project details."""
+        """Get project details (also refreshes the cached issue types)."""
         client = await self._get_client()
         response = await client.get(f"/project/{self.project_key}")
 
@@ -134,30 +181,30 @@ class JiraAgent:
             raise JiraAgentError(f"Failed to get project: {response.text}")
 
         project = response.json()
+        self._project = project
         self._project_id = project.get("id")
+
+        # Cache issue type IDs from the same response
+        self._issue_types = {it["name"]: it["id"] for it in project.get("issueTypes", [])}
+        _issue_types_cache[(self.jira_url, self.project_key)] = (
+            time.monotonic() + _ISSUE_TYPES_TTL_SECONDS,
+            self._issue_types,
+        )
+
         return project
 
     async def get_issue_types(self) -> List[Dict[str, Any]]:
         """Get available issue types for the project."""
-        client = await self._get_client()
-        response = await client.get(f"/project/{self.project_key}")
-
-        if response.status_code != 200:
-            raise JiraAgentError(f"Failed to get issue types: {response.text}")
-
-        project = response.json()
-        issue_types = project.get("issueTypes", [])
-
-        # Cache issue type IDs
-        for it in issue_types:
-            self._issue_types[it["name"]] = it["id"]
-
-        return issue_types
+        project = self._project or await self.get_project()
+        return project.get("issueTypes", [])
 
     async def _get_issue_type_id(self, issue_type: JiraIssueType) -> str:
         """Get issue type ID by name."""
-        if not self._issue_types:
-            await self.get_issue_types()
+        cached = _issue_types_cache.get((self.jira_url, self.project_key))
+        if cached and cached[0] > time.monotonic():
+            self._issue_types = cached[1]
+        else:
+            await self.get_project()
 
         # Try exact match first
         if issue_type.value in self._issue_types:
@@ -182,59 +229,55 @@ class JiraAgent:
         """Format description in Atlassian Document Format (ADF)."""
         content = []
 
-        # Add main description
+        # Add main description in a single pass, grouping consecutive
+        # "* " lines into one bulletList node where they appear
         if ticket.description:
-            # Split description by newlines and create paragraphs
-            paragraphs = ticket.description.strip().split('\n')
-            for para in paragraphs:
+            current_list: Optional[List[Dict[str, Any]]] = None
+            for para in ticket.description.strip().split('\n'):
                 para = para.strip()
-                if para:
-                    # Check if it's a heading (starts with h3. or similar)
-                    if para.startswith('h3. '):
-                        content.append({
-                            "type": "heading",
-                            "attrs": {"level": 3},
-                            "content": [{"type": "text", "text": para[4:]}]
-                        })
-                    elif para.startswith('h2. '):
-                        content.append({
-                            "type": "heading",
-                            "attrs": {"level": 2},
-                            "content": [{"type": "text", "text": para[4:]}]
-                        })
-                    elif para.startswith('* '):
-                        # Start collecting bullet points
-                        # This is handled separately below
-                        pass
-                    elif para.startswith('----'):
-                        # Horizontal rule
-                        content.append({"type": "rule"})
-                    elif para.startswith('_') and para.endswith('_'):
-                        # Italic text
-                        content.append({
+                if para.startswith('* '):
+                    if current_list is None:
+                        current_list = []
+                        content.append({"type": "bulletList", "content": current_list})
+                    current_list.append({
+                        "type": "listItem",
+                        "content": [{
                             "type": "paragraph",
-                            "content": [{
-                                "type": "text",
-                                "text": para[1:-1],
-                                "marks": [{"type": "em"}]
-                            }]
-                        })
-                    else:
-                        # Check for bold markers *text*
-                        if para.startswith('*') and '*' in para[1:]:
-                            # Handle bold text like *Story Points:* 5
-                            content.append({
-                                "type": "paragraph",
-                                "content": self._parse_text_with_formatting(para)
-                            })
-                        else:
-                            content.append({
-                                "type": "paragraph",
-                                "content": [{"type": "text", "text": para}]
-                            })
-
-            # Now handle bullet lists - collect consecutive bullet points
-            self._add_bullet_lists(content, ticket.description)
+                            "content": [{"type": "text", "text": para[2:]}]
+                        }]
+                    })
+                    continue
+
+                # Any other line (including a blank one) ends the current list
+                current_list = None
+                if not para:
+                    continue
+
+                # Headings ("h3. ", "h2. ") and rules ("----") share a 4-char prefix
+                handler = _PREFIX_HANDLERS.get(para[:4])
+                if handler is not None:
+                    content.append(handler(para))
+                elif para.startswith('_') and para.endswith('_'):
+                    # Italic text
+                    content.append({
+                        "type": "paragraph",
+                        "content": [{
+                            "type": "text",
+                            "text": para[1:-1],
+                            "marks": [{"type": "em"}]
+                        }]
+                    })
+                elif para.startswith('*') and '*' in para[1:]:
+                    # Handle bold text like *Story Points:* 5
+                    content.append({
+                        "type": "paragraph",
+                        "content": self._parse_text_with_formatting(para)
+                    })
+                else:
+                    content.append({
+                        "type": "paragraph",
+                        "content": [{"type": "text", "text": para}]
+                    })
 
         # Add acceptance criteria if present (from ticket object, not description)
         if ticket.acceptance_criteria:
@@ -262,7 +305,7 @@ class JiraAgent:
         return {
             "type": "doc",
             "version": 1,
-            "content": content if content else [{"type": "paragraph", "content": [{"type": "text", "text": "No description provided."}]}]
+            "content": content or [{"type": "paragraph", "content": [{"type": "text", "text": "No description provided."}]}]
         }
 
     def _parse_text_with_formatting(self, text: str) -> List[Dict[str, Any]]:
@@ -285,59 +328,42 @@ class JiraAgent:
 
         return result if result else [{"type": "text", "text": text}]
 
-    def _add_bullet_lists(self, content: List[Dict], description: str):
-        """Extract bullet lists from description and add them to content."""
-        lines = description.strip().split('\n')
-        i = 0
-        insert_positions = []
-
-        while i < len(lines):
-            line = lines[i].strip()
-            if line.startswith('* '):
-                # Found start of a bullet list
-                list_items = []
-                while i < len(lines) and lines[i].strip().startswith('* '):
-                    item_text = lines[i].strip()[2:]  # Remove '* '
-                    list_items.append({
-                        "type": "listItem",
-                        "content": [{
-                            "type": "paragraph",
-                            "content": [{"type": "text", "text": item_text}]
-                        }]
-                    })
-                    i += 1
-
-                # Find the right position to insert (after the heading before the list)
-                insert_positions.append({
-                    "type": "bulletList",
-                    "content": list_items
-                })
-            else:
-                i += 1
-
-        # Remove any plain text bullet items that were added as paragraphs and add the lists
-        # Filter out paragraphs that start with "* "
-        filtered_content = [item for item in content if not (
-            item.get("type") == "paragraph" and
-            item.get("content") and
-            item["content"][0].get("text", "").startswith("* ")
-        )]
-        content.clear()
-        content.extend(filtered_content)
-
-        # Add bullet lists at appropriate positions (after headings)
-        for bullet_list in insert_positions:
-            content.append(bullet_list)
-
     async def create_ticket(self, ticket: JiraTicket) -> JiraCreatedTicket:
         """Create a single Jira ticket."""
+        async with self._interactive_semaphore:
+            return await self._create_ticket(ticket)
+
+    async def _create_ticket(self, ticket: JiraTicket) -> JiraCreatedTicket:
+        """Create a single Jira ticket without taking a concurrency slot."""
         if not self.is_configured:
             raise JiraAgentError("Jira is not configured")
 
         client = await self._get_client()
+        payload = await self._build_issue_payload(ticket)
+
+        # Pre-serialize with orjson; the client already sends a JSON Content-Type
+        response = await client.post("/issue", content=orjson.dumps(payload))
+
+        if response.status_code not in (200, 201):
+            error_msg = response.text
+            try:
+                error_msg = self._format_error(response.json()) or error_msg
+            except:
+                pass
+            raise JiraAgentError(f"Failed to create ticket: {error_msg}")
+
+        result = orjson.loads(response.content)
+        return JiraCreatedTicket(
+            key=result["key"],
+            id=result["id"],
+            url=f"{self.jira_url}/browse/{result['key']}",
+            summary=ticket.summary,
+        )
+
+    async def _build_issue_payload(self, ticket: JiraTicket) -> Dict[str, Any]:
+        """Build the create-issue payload for a ticket."""
         issue_type_id = await self._get_issue_type_id(ticket.issue_type)
 
-        # Build the issue payload
         fields = {
             "project": {"key": self.project_key},
             "summary": ticket.summary[:255],  # Jira summary limit
@@ -358,43 +384,109 @@ class JiraAgent:
         # Note: Story points field name varies by Jira instance
         # Common names: "Story Points", "customfield_10016", etc.
 
-        payload = {"fields": fields}
+        return {"fields": fields}
 
-        response = await client.post("/issue", json=payload)
+    @staticmethod
+    def _format_error(error_data: Dict[str, Any]) -> Optional[str]:
+        """Summarize a Jira error body ({"errors": {...}} or {"errorMessages": [...]})."""
+        if error_data.get("errors"):
+            return orjson.dumps(error_data["errors"]).decode()
+        if error_data.get("errorMessages"):
+            return ", ".join(error_data["errorMessages"])
+        return None
 
-        if response.status_code not in (200, 201):
-            error_msg = response.text
-            try:
-                error_data = response.json()
-                if "errors" in error_data:
-                    error_msg = json.dumps(error_data["errors"])
-                elif "errorMessages" in error_data:
-                    error_msg = ", ".join(error_data["errorMessages"])
-            except:
-                pass
-            raise JiraAgentError(f"Failed to create ticket: {error_msg}")
+    async def create_tickets(
+        self, tickets: List[JiraTicket]
+    ) -> List[Union[JiraCreatedTicket, JiraAgentError]]:
+        """
+        Create Jira tickets concurrently.
+
+        Returns one entry per ticket, in input order: the created ticket, or the
+        JiraAgentError it failed with. Any other exception propagates.
+        """
+        async def create_bounded(ticket: JiraTicket) -> Union[JiraCreatedTicket, JiraAgentError]:
+            async with self._bulk_semaphore:
+                try:
+                    return await self._create_ticket(ticket)
+                except JiraAgentError as e:
+                    return e
+
+        return await asyncio.gather(*(create_bounded(ticket) for ticket in tickets))
+
+    async def create_tickets_bulk(
+        self, tickets: List[JiraTicket]
+    ) -> List[Union[JiraCreatedTicket, JiraAgentError]]:
+        """
+        Create Jira tickets through the bulk endpoint, up to 50 per request.
 
-        result = response.json()
-        return JiraCreatedTicket(
-            key=result["key"],
-            id=result["id"],
-            url=f"{self.jira_url}/browse/{result['key']}",
-            summary=ticket.summary,
+        Returns one entry per ticket, in input order, like create_tickets.
+        """
+        if not self.is_configured:
+            return [JiraAgentError("Jira is not configured")] * len(tickets)
+
+        client = await self._get_client()
+        try:
+            payloads = [await self._build_issue_payload(ticket) for ticket in tickets]
+        except JiraAgentError as e:
+            # Issue types could not be resolved, so no ticket can be created
+            return [e] * len(tickets)
+
+        async def create_chunk(start: int) -> List[Union[JiraCreatedTicket, JiraAgentError]]:
+            chunk = tickets[start:start + _BULK_CREATE_LIMIT]
+            body = {"issueUpdates": payloads[start:start + _BULK_CREATE_LIMIT]}
+            async with self._bulk_semaphore:
+                response = await client.post("/issue/bulk", content=orjson.dumps(body))
+
+            try:
+                data = orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                data = {}
+
+            # Failed elements are reported by index; created issues are listed
+            # in order for the remaining elements
+            failures = {
+                error.get("failedElementNumber"): JiraAgentError(
+                    f"Failed to create ticket: {self._format_error(error.get('elementErrors', {})) or error.get('status')}"
+                )
+                for error in data.get("errors", [])
+            }
+            issues = iter(data.get("issues", []))
+
+            results: List[Union[JiraCreatedTicket, JiraAgentError]] = []
+            for index, ticket in enumerate(chunk):
+                if index in failures:
+                    results.append(failures[index])
+                    continue
+                issue = next(issues, None)
+                if issue is None:
+                    results.append(JiraAgentError(
+                        f"Failed to create ticket: {self._format_error(data) or response.text}"
+                    ))
+                    continue
+                results.append(JiraCreatedTicket(
+                    key=issue["key"],
+                    id=issue["id"],
+                    url=f"{self.jira_url}/browse/{issue['key']}",
+                    summary=ticket.summary,
+                ))
+            return results
+
+        chunks = await asyncio.gather(
+            *(create_chunk(start) for start in range(0, len(tickets), _BULK_CREATE_LIMIT))
         )
+        return [result for chunk in chunks for result in chunk]
 
     async def create_tickets_batch(
         self, tickets: List[JiraTicket]
     ) -> List[JiraCreatedTicket]:
-        """Create multiple Jira tickets."""
+        """Create multiple Jira tickets concurrently."""
         created = []
         errors = []
-
-        for ticket in tickets:
-            try:
-                result = await self.create_ticket(ticket)
+        for ticket, result in zip(tickets, await self.create_tickets(tickets)):
+            if isinstance(result, JiraAgentError):
+                errors.append(f"{ticket.summary}: {str(result)}")
+            else:
                 created.append(result)
-            except JiraAgentError as e:
-                errors.append(f"{ticket.summary}: {str(e)}")
 
         if errors and not created:
             raise JiraAgentError(f"All tickets failed to create: {'; '.join(errors)}")
@@ -501,12 +593,7 @@ def action_item_to_jira_ticket(
 
 
 # Singleton instance
-_jira_agent: Optional[JiraAgent] = None
-
-
+@lru_cache(maxsize=1)
 def get_jira_agent() -> JiraAgent:
     """Get or create the Jira agent singleton."""
-    global _jira_agent
-    if _jira_agent is None:
-        _jira_agent = JiraAgent()
-    return _jira_agent
+    return JiraAgent()
@@ -1,15 +1,26 @@
 """Main FastAPI application for AI Sprint Companion."""
-from fastapi import FastAPI, Request, Form, UploadFile, File
-from fastapi.responses import HTMLResponse
+import logging
+import queue
+import re
+import time
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+
+import httpx
+import jinja2
+import orjson
+from fastapi import FastAPI, HTTPException, Request, Form, UploadFile, File
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from . import __version__
 from .ai import get_ai_service
 from .config import get_settings
-from .document_parser import extract_text_from_file
+from .document_parser import extract_text_from_file, shutdown_pdf_pool
 from .jira_agent import (
     get_jira_agent,
     JiraAgentError,
@@ -26,12 +37,143 @@ from .schemas import (
     UserStoriesResponse,
     SprintTasksResponse,
     JiraConfigStatus,
+    JiraConnectionTestResponse,
+    JiraProjectInfo,
+    JiraUserInfo,
     JiraTicketRequest,
     JiraTicketResponse,
     JiraBulkCreateRequest,
     JiraBulkCreateResponse,
 )
 
+logger = logging.getLogger(__name__)
+
+# "Name: yesterday | today | blockers" -- fields after the first are optional and
+# anything past a third "|" is ignored
+_STANDUP_LINE_RE = re.compile(r'([^:]*):([^|]*)(?:\|([^|]*))?(?:\|([^|]*))?')
+
+# Form/request values -> Jira issue types and priorities (unknown values fall back to Task/Medium)
+_ISSUE_TYPE_MAP = {
+    "Story": JiraIssueType.STORY,
+    "Task": JiraIssueType.TASK,
+    "Bug": JiraIssueType.BUG,
+}
+_PRIORITY_MAP = {
+    "high": "High",
+    "medium": "Medium",
+    "low": "Low",
+}
+
+# Most tickets one bulk request may create (matches JiraBulkCreateRequest.tickets)
+_MAX_BULK_ITEMS = 100
+# HTMX only swaps 2xx responses, so these errors are sent with 200 like the others
+_BULK_RATE_LIMITED_HTML = '<span class="jira-error">❌ Too many bulk requests, please wait a minute</span>'
+_BULK_TOO_MANY_HTML = f'<span class="jira-error">❌ At most {_MAX_BULK_ITEMS} tickets can be created at once</span>'
+
+_UPLOAD_TOO_LARGE_MESSAGE = "The uploaded file is too large."
+
+# Shortest notes worth generating stories from (matches UserStoryRequest.notes)
+_MIN_NOTES_LENGTH = 10
+
+# Footers appended to generated Jira descriptions
+_STORY_FOOTER = "\n\n----\n_This story was generated by AI Sprint Companion_"
+_TASK_FOOTER = "\n----\n_This task was generated by AI Sprint Companion_"
+_STANDUP_FOOTER = "\n----\n_This item was generated from standup summary by AI Sprint Companion_"
+
+
+def _story_description(description: str, acceptance_criteria: List[str], story_points) -> str:
+    """Build the Jira description for a generated user story."""
+    parts = [f"h3. User Story\n{description}\n"]
+    if acceptance_criteria:
+        parts.append("\nh3. Acceptance Criteria\n")
+        parts.extend(f"* {criteria}\n" for criteria in acceptance_criteria)
+    if story_points:
+        parts.append(f"\nh3. Estimation\n*Story Points:* {story_points}")
+    parts.append(_STORY_FOOTER)
+    return "".join(parts)
+
+
+def _task_description(description: str, parent_story: Optional[str], estimated_hours) -> str:
+    """Build the Jira description for a generated sprint task."""
+    parts = [f"h3. Task Description\n{description}\n"]
+    if parent_story:
+        parts.append(f"\nh3. Related User Story\n{parent_story}\n")
+    if estimated_hours:
+        parts.append(f"\nh3. Estimation\n*Estimated Hours:* {estimated_hours}h\n")
+    parts.append(_TASK_FOOTER)
+    return "".join(parts)
+
+
+def _story_ticket(story: dict) -> JiraTicket:
+    """Build a Jira Story from one generated story in a create-all request body."""
+    return JiraTicket(
+        summary=story.get("title", "Untitled Story")[:255],
+        description=_story_description(
+            story.get("description", ""),
+            story.get("acceptance_criteria", []),
+            story.get("story_points"),
+        ),
+        issue_type=JiraIssueType.STORY,
+        priority="Medium",
+        labels=["ai-generated", "user-story"],
+    )
+
+
+def _task_ticket(task: dict) -> JiraTicket:
+    """Build a Jira Task from one generated task in a create-all request body."""
+    return JiraTicket(
+        summary=task.get("title", "Untitled Task")[:255],
+        description=_task_description(
+            task.get("description", ""),
+            task.get("parent_story"),
+            task.get("estimated_hours"),
+        ),
+        issue_type=JiraIssueType.TASK,
+        priority=_PRIORITY_MAP.get(task.get("priority", "medium").lower(), "Medium"),
+        labels=["ai-generated", "sprint-task"],
+    )
+
+
+def _standup_suffix(summary_context: Optional[str]) -> str:
+    """Build the context block and footer shared by every item from one standup."""
+    if summary_context:
+        return f"\nh3. Standup Context\n{summary_context}\n{_STANDUP_FOOTER}"
+    return _STANDUP_FOOTER
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Configure logging and warm the Jira cache, then release shared services on shutdown."""
+    # Diagnostics are logged at DEBUG, so they cost nothing unless DEBUG=true.
+    # Handlers only enqueue records; a listener thread does the blocking writes.
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    log_listener = QueueListener(log_queue, logging.StreamHandler())
+    logging.basicConfig(
+        level=logging.DEBUG if get_settings().debug else logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+        handlers=[queue_handler],
+    )
+    log_listener.start()
+    # Compile every template before the first request needs it
+    for name in templates.env.list_templates():
+        templates.env.get_template(name)
+    # Open the shared Jira connection pool up front so it lives for the whole app
+    jira_agent = get_jira_agent()
+    if jira_agent.is_configured:
+        await jira_agent._get_client()
+        try:
+            await jira_agent.get_issue_types()
+        except (JiraAgentError, httpx.HTTPError) as e:
+            logger.warning("[Startup] Could not pre-load Jira issue types: %s", e)
+    yield
+    await jira_agent.close()
+    await get_ai_service().close()
+    shutdown_pdf_pool()
+    logging.getLogger().removeHandler(queue_handler)
+    log_listener.stop()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="AI Sprint Companion",
@@ -39,13 +181,89 @@ app = FastAPI(
     version=__version__,
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # Setup templates and static files
 BASE_DIR = Path(__file__).resolve().parent
-templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
+# Templates only change on deploy: skip the per-render mtime check and never evict
+templates = Jinja2Templates(env=jinja2.Environment(
+    loader=jinja2.FileSystemLoader(BASE_DIR / "templates"),
+    autoescape=jinja2.select_autoescape(),
+    auto_reload=False,
+    cache_size=-1,
+))
 app.mount("/static", StaticFiles(directory=str(BASE_DIR / "static")), name="static")
 
+# Full pages don't depend on the request, so browsers may reuse them briefly too
+_PAGE_CACHE_HEADERS = {"Cache-Control": "public, max-age=60"}
+
+
+@lru_cache(maxsize=16)
+def _render_page(name: str, **context) -> str:
+    """Render a page template once per distinct context."""
+    return templates.get_template(name).render(**context)
+
+
+def _page_response(name: str, **context) -> HTMLResponse:
+    """Serve a cached page render."""
+    return HTMLResponse(_render_page(name, **context), headers=_PAGE_CACHE_HEADERS)
+
+
+def _upload_too_large(request: Request):
+    """Reject an upload over MAX_UPLOAD_BYTES: JSON for the API, the error partial for pages."""
+    if request.url.path.startswith("/api/"):
+        return JSONResponse({"detail": _UPLOAD_TOO_LARGE_MESSAGE}, status_code=413)
+    # HTMX only swaps 2xx responses, so its partial is sent with 200 like the bulk errors
+    return templates.TemplateResponse(
+        request,
+        "partials/error.html",
+        {"message": _UPLOAD_TOO_LARGE_MESSAGE},
+        status_code=200 if request.headers.get("hx-request") else 413,
+    )
+
+
+class _TokenBucket:
+    """Non-blocking token bucket refilling `rate` tokens per `period` seconds."""
+
+    __slots__ = ("rate", "period", "tokens", "updated")
+
+    def __init__(self, rate: int, period: float = 60.0):
+        self.rate = rate
+        self.period = period
+        self.tokens = float(rate)
+        self.updated = time.monotonic()
+
+    def take(self) -> bool:
+        """Take one token, or return False if the bucket is empty."""
+        now = time.monotonic()
+        self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate / self.period)
+        self.updated = now
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+@lru_cache(maxsize=1024)
+def _bulk_rate_limiter(client_host: str) -> _TokenBucket:
+    """Get the token bucket for one client's bulk Jira requests (least recent clients are evicted)."""
+    return _TokenBucket(get_settings().jira_bulk_requests_per_minute)
+
+
+def _admit_bulk_request(request: Request) -> bool:
+    """Take a token from the client's bulk bucket, or return False if it is empty."""
+    return _bulk_rate_limiter(request.client.host if request.client else "unknown").take()
+
+
+@app.middleware("http")
+async def limit_upload_size(request: Request, call_next):
+    """Reject oversize request bodies from Content-Length before they are read."""
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > get_settings().max_upload_bytes:
+        return _upload_too_large(request)
+    return await call_next(request)
+
 
 # ============================================================================
 # Health & Info Endpoints
@@ -65,7 +283,7 @@ async def health_check():
 @app.get("/", response_class=HTMLResponse, tags=["Pages"])
 async def home(request: Request):
     """Render the home page."""
-    return templates.TemplateResponse("index.html", {"request": request})
+    return _page_response("index.html")
 
 
 # ============================================================================
@@ -82,10 +300,23 @@ async def summarize_standup(payload: StandupSummaryRequest):
     )
 
 
+@app.post("/api/standup/summarize/stream", tags=["Standup"])
+async def summarize_standup_stream(payload: StandupSummaryRequest):
+    """Stream the standup summary JSON as it is generated."""
+    ai_service = get_ai_service()
+    return StreamingResponse(
+        ai_service.summarize_standup_stream(
+            entries=payload.entries,
+            sprint_goal=payload.sprint_goal,
+        ),
+        media_type="application/json",
+    )
+
+
 @app.get("/standup", response_class=HTMLResponse, tags=["Pages"])
 async def standup_page(request: Request):
     """Render the standup summary page."""
-    return templates.TemplateResponse("standup.html", {"request": request})
+    return _page_response("standup.html")
 
 
 @app.post("/standup/summarize", response_class=HTMLResponse, tags=["HTMX"])
@@ -99,20 +330,23 @@ async def htmx_summarize_standup(
     combined_text = ""
 
     # Priority: Use textarea content first (it may contain file content loaded by JS for .txt files)
-    if entries_text.strip():
-        combined_text = entries_text.strip()
-        print(f"[Standup] Using textarea content: {len(combined_text)} chars")
+    if stripped := entries_text.strip():
+        combined_text = stripped
+        logger.debug("[Standup] Using textarea content: %d chars", len(combined_text))
     # If textarea is empty but file is uploaded, extract from file (for PDF, DOC, DOCX)
     elif file and file.filename:
-        content = await file.read()
-        await file.seek(0)
-        if content and len(content) > 0:
-            print(f"[Standup] File received: {file.filename}, size: {len(content)} bytes")
-            file_text = await extract_text_from_file(file) or ""
-            print(f"[Standup] Extracted text length: {len(file_text)}")
-            if file_text.strip():
-                combined_text = file_text.strip()
-                print(f"[Standup] Using extracted file content: {len(combined_text)} chars")
+        # The upload is already spooled by the multipart parser; check its size
+        # without pulling it into memory a second time (chunked bodies carry no
+        # Content-Length, so the middleware cannot catch them)
+        if file.size and file.size > get_settings().max_upload_bytes:
+            return _upload_too_large(request)
+        if file.size:
+            logger.debug("[Standup] File received: %s, size: %d bytes", file.filename, file.size)
+            file_text = (await extract_text_from_file(file) or "").strip()
+            logger.debug("[Standup] Extracted text length: %d", len(file_text))
+            if file_text:
+                combined_text = file_text
+                logger.debug("[Standup] Using extracted file content: %d chars", len(combined_text))
 
     if not combined_text:
         return templates.TemplateResponse(
@@ -122,16 +356,15 @@ async def htmx_summarize_standup(
 
     # Parse entries from text (simple format: Name: yesterday | today | blockers)
     entries = []
-    for line in combined_text.strip().split("\n"):
-        if ":" in line:
-            parts = line.split(":", 1)
-            name = parts[0].strip()
-            details = parts[1].split("|") if "|" in parts[1] else [parts[1], "", ""]
+    for line in combined_text.splitlines():
+        match = _STANDUP_LINE_RE.match(line)
+        if match:
+            name, yesterday, today, blockers = match.groups()
             entries.append(StandupEntry(
-                name=name,
-                yesterday=details[0].strip() if len(details) > 0 else "",
-                today=details[1].strip() if len(details) > 1 else "",
-                blockers=details[2].strip() if len(details) > 2 else None,
+                name=name.strip(),
+                yesterday=yesterday.strip(),
+                today=today.strip() if today is not None else "",
+                blockers=blockers.strip() if blockers is not None else None,
             ))
 
     if not entries:
@@ -175,7 +408,7 @@ async def generate_user_stories(payload: MeetingNotesRequest):
 @app.get("/stories", response_class=HTMLResponse, tags=["Pages"])
 async def stories_page(request: Request):
     """Render the user stories page."""
-    return templates.TemplateResponse("stories.html", {"request": request})
+    return _page_response("stories.html")
 
 
 @app.post("/stories/generate", response_class=HTMLResponse, tags=["HTMX"])
@@ -186,25 +419,26 @@ async def htmx_generate_stories(
     file: Optional[UploadFile] = File(None),
 ):
     """HTMX endpoint to generate user stories (form submission with file upload)."""
-    combined_text = ""
-
     # Priority: Use textarea content first (it may contain file content loaded by JS for .txt files)
-    if notes.strip():
-        combined_text = notes.strip()
-        print(f"[Stories] Using textarea content: {len(combined_text)} chars")
-    # If textarea is empty but file is uploaded, extract from file (for PDF, DOC, DOCX)
+    combined_text = notes.strip()
+    if len(combined_text) >= _MIN_NOTES_LENGTH:
+        logger.debug("[Stories] Using textarea content: %d chars", len(combined_text))
+    # If the textarea is too short to use but a file is uploaded, extract from file (for PDF, DOC, DOCX)
     elif file and file.filename:
-        content = await file.read()
-        await file.seek(0)
-        if content and len(content) > 0:
-            print(f"[Stories] File received: {file.filename}, size: {len(content)} bytes")
-            file_text = await extract_text_from_file(file) or ""
-            print(f"[Stories] Extracted text length: {len(file_text)}")
-            if file_text.strip():
-                combined_text = file_text.strip()
-                print(f"[Stories] Using extracted file content: {len(combined_text)} chars")
-
-    if len(combined_text) < 10:
+        # The upload is already spooled by the multipart parser; check its size
+        # without pulling it into memory a second time (chunked bodies carry no
+        # Content-Length, so the middleware cannot catch them)
+        if file.size and file.size > get_settings().max_upload_bytes:
+            return _upload_too_large(request)
+        if file.size:
+            logger.debug("[Stories] File received: %s, size: %d bytes", file.filename, file.size)
+            file_text = (await extract_text_from_file(file) or "").strip()
+            logger.debug("[Stories] Extracted text length: %d", len(file_text))
+            if len(file_text) >= _MIN_NOTES_LENGTH:
+                combined_text = file_text
+                logger.debug("[Stories] Using extracted file content: %d chars", len(combined_text))
+
+    if len(combined_text) < _MIN_NOTES_LENGTH:
         return templates.TemplateResponse(
             "partials/error.html",
             {"request": request, "message": "Please provide more detailed meeting notes (at least 10 characters) or upload a document."},
@@ -237,7 +471,7 @@ async def suggest_sprint_tasks(payload: SprintTaskRequest):
 @app.get("/tasks", response_class=HTMLResponse, tags=["Pages"])
 async def tasks_page(request: Request):
     """Render the sprint tasks page."""
-    return templates.TemplateResponse("tasks.html", {"request": request})
+    return _page_response("tasks.html")
 
 
 @app.post("/tasks/suggest", response_class=HTMLResponse, tags=["HTMX"])
@@ -252,22 +486,25 @@ async def htmx_suggest_tasks(
     combined_text = ""
 
     # Priority: Use textarea content first (it may contain file content loaded by JS for .txt files)
-    if user_stories.strip():
-        combined_text = user_stories.strip()
-        print(f"[Tasks] Using textarea content: {len(combined_text)} chars")
+    if stripped := user_stories.strip():
+        combined_text = stripped
+        logger.debug("[Tasks] Using textarea content: %d chars", len(combined_text))
     # If textarea is empty but file is uploaded, extract from file (for PDF, DOC, DOCX)
     elif file and file.filename:
-        content = await file.read()
-        await file.seek(0)
-        if content and len(content) > 0:
-            print(f"[Tasks] File received: {file.filename}, size: {len(content)} bytes")
-            file_text = await extract_text_from_file(file) or ""
-            print(f"[Tasks] Extracted text length: {len(file_text)}")
-            if file_text.strip():
-                combined_text = file_text.strip()
-                print(f"[Tasks] Using extracted file content: {len(combined_text)} chars")
-
-    stories = [s.strip() for s in combined_text.split("\n") if s.strip()]
+        # The upload is already spooled by the multipart parser; check its size
+        # without pulling it into memory a second time (chunked bodies carry no
+        # Content-Length, so the middleware cannot catch them)
+        if file.size and file.size > get_settings().max_upload_bytes:
+            return _upload_too_large(request)
+        if file.size:
+            logger.debug("[Tasks] File received: %s, size: %d bytes", file.filename, file.size)
+            file_text = (await extract_text_from_file(file) or "").strip()
+            logger.debug("[Tasks] Extracted text length: %d", len(file_text))
+            if file_text:
+                combined_text = file_text
+                logger.debug("[Tasks] Using extracted file content: %d chars", len(combined_text))
+
+    stories = [s for s in (line.strip() for line in combined_text.splitlines()) if s]
 
     if not stories:
         return templates.TemplateResponse(
@@ -308,35 +545,33 @@ async def jira_status():
     return status
 
 
-@app.get("/api/jira/test", tags=["Jira"])
+@app.get("/api/jira/test", response_model=JiraConnectionTestResponse, tags=["Jira"])
 async def jira_test_connection():
     """Test Jira connection and return user info."""
     agent = get_jira_agent()
 
     if not agent.is_configured:
-        return {
-            "success": False,
-            "error": "Jira is not configured. Please set JIRA_URL, JIRA_EMAIL, JIRA_API_TOKEN, and JIRA_PROJECT_KEY."
-        }
+        return JiraConnectionTestResponse(
+            success=False,
+            error="Jira is not configured. Please set JIRA_URL, JIRA_EMAIL, JIRA_API_TOKEN, and JIRA_PROJECT_KEY."
+        )
 
     try:
         user_info = await agent.test_connection()
         project_info = await agent.get_project()
-        return {
-            "success": True,
-            "user": {
-                "displayName": user_info.get("displayName"),
-                "emailAddress": user_info.get("emailAddress"),
-            },
-            "project": {
-                "key": project_info.get("key"),
-                "name": project_info.get("name"),
-            }
-        }
+        return JiraConnectionTestResponse(
+            success=True,
+            user=JiraUserInfo(
+                displayName=user_info.get("displayName"),
+                emailAddress=user_info.get("emailAddress"),
+            ),
+            project=JiraProjectInfo(
+                key=project_info.get("key"),
+                name=project_info.get("name"),
+            ),
+        )
     except JiraAgentError as e:
-        return {"success": False, "error": str(e)}
-    finally:
-        await agent.close()
+        return JiraConnectionTestResponse(success=False, error=str(e))
 
 
 @app.post("/api/jira/ticket", response_model=JiraTicketResponse, tags=["Jira"])
@@ -352,16 +587,10 @@ async def create_jira_ticket(request: JiraTicketRequest):
 
     try:
         # Convert request to JiraTicket
-        issue_type_map = {
-            "Story": JiraIssueType.STORY,
-            "Task": JiraIssueType.TASK,
-            "Bug": JiraIssueType.BUG,
-        }
-
         ticket = JiraTicket(
             summary=request.summary,
             description=request.description,
-            issue_type=issue_type_map.get(request.issue_type, JiraIssueType.TASK),
+            issue_type=_ISSUE_TYPE_MAP.get(request.issue_type, JiraIssueType.TASK),
             priority=request.priority,
             labels=request.labels or ["ai-generated"],
             acceptance_criteria=request.acceptance_criteria,
@@ -377,12 +606,10 @@ async def create_jira_ticket(request: JiraTicketRequest):
         )
     except JiraAgentError as e:
         return JiraTicketResponse(success=False, error=str(e))
-    finally:
-        await agent.close()
 
 
 @app.post("/api/jira/tickets/bulk", response_model=JiraBulkCreateResponse, tags=["Jira"])
-async def create_jira_tickets_bulk(request: JiraBulkCreateRequest):
+async def create_jira_tickets_bulk(request: JiraBulkCreateRequest, http_request: Request):
     """Create multiple Jira tickets at once."""
     agent = get_jira_agent()
 
@@ -392,50 +619,47 @@ async def create_jira_tickets_bulk(request: JiraBulkCreateRequest):
             failed=[JiraTicketResponse(success=False, error="Jira is not configured")]
         )
 
+    if not _admit_bulk_request(http_request):
+        raise HTTPException(status_code=429, detail="Too many bulk requests, please wait a minute")
+
     created = []
     failed = []
 
-    try:
-        issue_type_map = {
-            "Story": JiraIssueType.STORY,
-            "Task": JiraIssueType.TASK,
-            "Bug": JiraIssueType.BUG,
-        }
-
-        for req in request.tickets:
-            try:
-                ticket = JiraTicket(
-                    summary=req.summary,
-                    description=req.description,
-                    issue_type=issue_type_map.get(req.issue_type, JiraIssueType.TASK),
-                    priority=req.priority,
-                    labels=req.labels or ["ai-generated"],
-                    acceptance_criteria=req.acceptance_criteria,
-                )
-
-                result = await agent.create_ticket(ticket)
-                created.append(JiraTicketResponse(
-                    success=True,
-                    key=result.key,
-                    url=result.url,
-                    summary=result.summary,
-                ))
-            except JiraAgentError as e:
-                failed.append(JiraTicketResponse(
-                    success=False,
-                    summary=req.summary,
-                    error=str(e),
-                ))
-
-        return JiraBulkCreateResponse(
-            success=len(failed) == 0,
-            created=created,
-            failed=failed,
-            total_created=len(created),
-            total_failed=len(failed),
+    tickets = [
+        JiraTicket(
+            summary=req.summary,
+            description=req.description,
+            issue_type=_ISSUE_TYPE_MAP.get(req.issue_type, JiraIssueType.TASK),
+            priority=req.priority,
+            labels=req.labels or ["ai-generated"],
+            acceptance_criteria=req.acceptance_criteria,
         )
-    finally:
-        await agent.close()
+        for req in request.tickets
+    ]
+
+    # Results come back in request order
+    for req, result in zip(request.tickets, await agent.create_tickets_bulk(tickets)):
+        if isinstance(result, JiraAgentError):
+            failed.append(JiraTicketResponse(
+                success=False,
+                summary=req.summary,
+                error=str(result),
+            ))
+        else:
+            created.append(JiraTicketResponse(
+                success=True,
+                key=result.key,
+                url=result.url,
+                summary=result.summary,
+            ))
+
+    return JiraBulkCreateResponse(
+        success=len(failed) == 0,
+        created=created,
+        failed=failed,
+        total_created=len(created),
+        total_failed=len(failed),
+    )
 
 
 @app.get("/jira", response_class=HTMLResponse, tags=["Pages"])
@@ -443,12 +667,12 @@ async def jira_page(request: Request):
     """Render the Jira integration page."""
     agent = get_jira_agent()
     settings = get_settings()
-    return templates.TemplateResponse("jira.html", {
-        "request": request,
-        "jira_configured": agent.is_configured,
-        "project_key": settings.jira_project_key,
-        "jira_url": settings.jira_url,
-    })
+    return _page_response(
+        "jira.html",
+        jira_configured=agent.is_configured,
+        project_key=settings.jira_project_key,
+        jira_url=settings.jira_url,
+    )
 
 
 @app.post("/jira/create", response_class=HTMLResponse, tags=["HTMX"])
@@ -474,19 +698,13 @@ async def htmx_create_jira_ticket(
         )
 
     try:
-        issue_type_map = {
-            "Story": JiraIssueType.STORY,
-            "Task": JiraIssueType.TASK,
-            "Bug": JiraIssueType.BUG,
-        }
-
         label_list = [l.strip() for l in labels.split(",") if l.strip()]
         label_list.append("ai-generated")
 
         ticket = JiraTicket(
             summary=summary,
             description=description,
-            issue_type=issue_type_map.get(issue_type, JiraIssueType.TASK),
+            issue_type=_ISSUE_TYPE_MAP.get(issue_type, JiraIssueType.TASK),
             priority=priority if priority else None,
             labels=label_list,
         )
@@ -512,8 +730,6 @@ async def htmx_create_jira_ticket(
                 "error": str(e),
             },
         )
-    finally:
-        await agent.close()
 
 
 @app.post("/jira/create-from-story", response_class=HTMLResponse, tags=["HTMX"])
@@ -532,20 +748,8 @@ async def htmx_create_jira_from_story(
 
     try:
         # Build full description with proper Jira formatting
-        full_description = f"h3. User Story\n{description}\n"
-
-        if acceptance_criteria:
-            criteria_list = acceptance_criteria.split("||")
-            if criteria_list and criteria_list[0]:
-                full_description += "\nh3. Acceptance Criteria\n"
-                for criteria in criteria_list:
-                    if criteria.strip():
-                        full_description += f"* {criteria.strip()}\n"
-
-        if story_points:
-            full_description += f"\nh3. Estimation\n*Story Points:* {story_points}"
-
-        full_description += "\n\n----\n_This story was generated by AI Sprint Companion_"
+        criteria_list = [c for c in (criteria.strip() for criteria in acceptance_criteria.split("||")) if c]
+        full_description = _story_description(description, criteria_list, story_points)
 
         ticket = JiraTicket(
             summary=title[:255],
@@ -561,8 +765,6 @@ async def htmx_create_jira_from_story(
         )
     except JiraAgentError as e:
         return HTMLResponse(f'<span class="jira-error">❌ {str(e)}</span>')
-    finally:
-        await agent.close()
 
 
 @app.post("/jira/create-from-task", response_class=HTMLResponse, tags=["HTMX"])
@@ -582,28 +784,13 @@ async def htmx_create_jira_from_task(
 
     try:
         # Build full description with proper Jira formatting
-        full_description = f"h3. Task Description\n{description}\n"
-
-        if parent_story:
-            full_description += f"\nh3. Related User Story\n{parent_story}\n"
-
-        if estimated_hours:
-            full_description += f"\nh3. Estimation\n*Estimated Hours:* {estimated_hours}h\n"
-
-        full_description += "\n----\n_This task was generated by AI Sprint Companion_"
-
-        # Map priority
-        priority_map = {
-            "high": "High",
-            "medium": "Medium",
-            "low": "Low",
-        }
+        full_description = _task_description(description, parent_story, estimated_hours)
 
         ticket = JiraTicket(
             summary=title[:255],
             description=full_description,
             issue_type=JiraIssueType.TASK,
-            priority=priority_map.get(priority.lower(), "Medium"),
+            priority=_PRIORITY_MAP.get(priority.lower(), "Medium"),
             labels=["ai-generated", "sprint-task"],
         )
 
@@ -613,8 +800,6 @@ async def htmx_create_jira_from_task(
         )
     except JiraAgentError as e:
         return HTMLResponse(f'<span class="jira-error">❌ {str(e)}</span>')
-    finally:
-        await agent.close()
 
 
 @app.post("/jira/create-all-stories", response_class=HTMLResponse, tags=["HTMX"])
@@ -625,47 +810,29 @@ async def htmx_create_all_stories(request: Request):
     if not agent.is_configured:
         return HTMLResponse('<span class="jira-error">❌ Jira not configured</span>')
 
+    if not _admit_bulk_request(request):
+        return HTMLResponse(_BULK_RATE_LIMITED_HTML)
+
     try:
         # Get JSON data from request body
         body = await request.body()
-        import json
-        stories = json.loads(body) if body else []
+        stories = orjson.loads(body) if body else []
 
         if not stories:
             return HTMLResponse('<span class="jira-error">❌ No stories to create</span>')
+        if len(stories) > _MAX_BULK_ITEMS:
+            return HTMLResponse(_BULK_TOO_MANY_HTML)
+
+        tickets = [_story_ticket(story) for story in stories]
 
         created = []
         failed = []
 
-        for story in stories:
-            try:
-                # Build full description with proper Jira formatting
-                full_description = f"h3. User Story\n{story.get('description', '')}\n"
-
-                acceptance_criteria = story.get("acceptance_criteria", [])
-                if acceptance_criteria:
-                    full_description += "\nh3. Acceptance Criteria\n"
-                    for criteria in acceptance_criteria:
-                        full_description += f"* {criteria}\n"
-
-                story_points = story.get("story_points")
-                if story_points:
-                    full_description += f"\nh3. Estimation\n*Story Points:* {story_points}"
-
-                full_description += "\n\n----\n_This story was generated by AI Sprint Companion_"
-
-                ticket = JiraTicket(
-                    summary=story.get("title", "Untitled Story")[:255],
-                    description=full_description,
-                    issue_type=JiraIssueType.STORY,
-                    priority="Medium",
-                    labels=["ai-generated", "user-story"],
-                )
-
-                result = await agent.create_ticket(ticket)
-                created.append(f'<a href="{result.url}" target="_blank">{result.key}</a>')
-            except JiraAgentError as e:
+        for story, result in zip(stories, await agent.create_tickets_bulk(tickets)):
+            if isinstance(result, JiraAgentError):
                 failed.append(story.get("title", "Unknown"))
+            else:
+                created.append(f'<a href="{result.url}" target="_blank">{result.key}</a>')
 
         if created and not failed:
             return HTMLResponse(
@@ -680,8 +847,6 @@ async def htmx_create_all_stories(request: Request):
             return HTMLResponse(f'<span class="jira-error">❌ Failed to create tickets</span>')
     except Exception as e:
         return HTMLResponse(f'<span class="jira-error">❌ Error: {str(e)}</span>')
-    finally:
-        await agent.close()
 
 
 @app.post("/jira/create-all-tasks", response_class=HTMLResponse, tags=["HTMX"])
@@ -692,50 +857,28 @@ async def htmx_create_all_tasks(request: Request):
     if not agent.is_configured:
         return HTMLResponse('<span class="jira-error">❌ Jira not configured</span>')
 
+    if not _admit_bulk_request(request):
+        return HTMLResponse(_BULK_RATE_LIMITED_HTML)
+
     try:
         body = await request.body()
-        import json
-        tasks = json.loads(body) if body else []
+        tasks = orjson.loads(body) if body else []
 
         if not tasks:
             return HTMLResponse('<span class="jira-error">❌ No tasks to create</span>')
+        if len(tasks) > _MAX_BULK_ITEMS:
+            return HTMLResponse(_BULK_TOO_MANY_HTML)
 
-        priority_map = {
-            "high": "High",
-            "medium": "Medium",
-            "low": "Low",
-        }
+        tickets = [_task_ticket(task) for task in tasks]
 
         created = []
         failed = []
 
-        for task in tasks:
-            try:
-                # Build full description with proper Jira formatting
-                full_description = f"h3. Task Description\n{task.get('description', '')}\n"
-
-                parent_story = task.get("parent_story")
-                if parent_story:
-                    full_description += f"\nh3. Related User Story\n{parent_story}\n"
-
-                estimated_hours = task.get("estimated_hours")
-                if estimated_hours:
-                    full_description += f"\nh3. Estimation\n*Estimated Hours:* {estimated_hours}h\n"
-
-                full_description += "\n----\n_This task was generated by AI Sprint Companion_"
-
-                ticket = JiraTicket(
-                    summary=task.get("title", "Untitled Task")[:255],
-                    description=full_description,
-                    issue_type=JiraIssueType.TASK,
-                    priority=priority_map.get(task.get("priority", "medium").lower(), "Medium"),
-                    labels=["ai-generated", "sprint-task"],
-                )
-
-                result = await agent.create_ticket(ticket)
-                created.append(f'<a href="{result.url}" target="_blank">{result.key}</a>')
-            except JiraAgentError as e:
+        for task, result in zip(tasks, await agent.create_tickets_bulk(tickets)):
+            if isinstance(result, JiraAgentError):
                 failed.append(task.get("title", "Unknown"))
+            else:
+                created.append(f'<a href="{result.url}" target="_blank">{result.key}</a>')
 
         if created and not failed:
             return HTMLResponse(
@@ -750,8 +893,6 @@ async def htmx_create_all_tasks(request: Request):
             return HTMLResponse(f'<span class="jira-error">❌ Failed to create tickets</span>')
     except Exception as e:
         return HTMLResponse(f'<span class="jira-error">❌ Error: {str(e)}</span>')
-    finally:
-        await agent.close()
 
 
 @app.post("/jira/create-from-standup", response_class=HTMLResponse, tags=["HTMX"])
@@ -772,20 +913,7 @@ async def htmx_create_jira_from_standup(
     try:
         # Build full description with proper Jira formatting
         item_label = "Blocker" if item_type == "blocker" else "Action Item"
-
-        full_description = f"h3. {item_label}\n{description}\n"
-
-        if summary_context:
-            full_description += f"\nh3. Standup Context\n{summary_context}\n"
-
-        full_description += "\n----\n_This item was generated from standup summary by AI Sprint Companion_"
-
-        # Map issue type
-        issue_type_map = {
-            "Story": JiraIssueType.STORY,
-            "Task": JiraIssueType.TASK,
-            "Bug": JiraIssueType.BUG,
-        }
+        full_description = f"h3. {item_label}\n{description}\n{_standup_suffix(summary_context)}"
 
         # Set priority based on item type (blockers are higher priority)
         priority = "High" if item_type == "blocker" else "Medium"
@@ -800,7 +928,7 @@ async def htmx_create_jira_from_standup(
         ticket = JiraTicket(
             summary=title[:255],
             description=full_description,
-            issue_type=issue_type_map.get(issue_type, JiraIssueType.TASK),
+            issue_type=_ISSUE_TYPE_MAP.get(issue_type, JiraIssueType.TASK),
             priority=priority,
             labels=labels,
         )
@@ -811,8 +939,6 @@ async def htmx_create_jira_from_standup(
         )
     except JiraAgentError as e:
         return HTMLResponse(f'<span class="jira-error">❌ {str(e)}</span>')
-    finally:
-        await agent.close()
 
 
 @app.post("/jira/create-all-standup-items", response_class=HTMLResponse, tags=["HTMX"])
@@ -823,10 +949,12 @@ async def htmx_create_all_standup_items(request: Request):
     if not agent.is_configured:
         return HTMLResponse('<span class="jira-error">❌ Jira not configured</span>')
 
+    if not _admit_bulk_request(request):
+        return HTMLResponse(_BULK_RATE_LIMITED_HTML)
+
     try:
         body = await request.body()
-        import json
-        data = json.loads(body) if body else {}
+        data = orjson.loads(body) if body else {}
 
         blockers = data.get("blockers", [])
         action_items = data.get("action_items", [])
@@ -834,51 +962,40 @@ async def htmx_create_all_standup_items(request: Request):
 
         if not blockers and not action_items:
             return HTMLResponse('<span class="jira-error">❌ No items to create</span>')
+        if len(blockers) + len(action_items) > _MAX_BULK_ITEMS:
+            return HTMLResponse(_BULK_TOO_MANY_HTML)
 
-        created = []
-        failed = []
+        tickets = []
+        suffix = _standup_suffix(summary_context)
 
-        # Create tickets for blockers
+        # Tickets for blockers
         for blocker in blockers:
-            try:
-                full_description = f"h3. Blocker\n{blocker}\n"
-                if summary_context:
-                    full_description += f"\nh3. Standup Context\n{summary_context}\n"
-                full_description += "\n----\n_This item was generated from standup summary by AI Sprint Companion_"
-
-                ticket = JiraTicket(
-                    summary=f"Blocker: {blocker}"[:255],
-                    description=full_description,
-                    issue_type=JiraIssueType.TASK,
-                    priority="High",
-                    labels=["ai-generated", "standup", "blocker"],
-                )
-
-                result = await agent.create_ticket(ticket)
-                created.append(f'<a href="{result.url}" target="_blank">{result.key}</a>')
-            except JiraAgentError as e:
-                failed.append(blocker[:50])
+            tickets.append(JiraTicket(
+                summary=f"Blocker: {blocker}"[:255],
+                description=f"h3. Blocker\n{blocker}\n{suffix}",
+                issue_type=JiraIssueType.TASK,
+                priority="High",
+                labels=["ai-generated", "standup", "blocker"],
+            ))
 
-        # Create tickets for action items
+        # Tickets for action items
         for item in action_items:
-            try:
-                full_description = f"h3. Action Item\n{item}\n"
-                if summary_context:
-                    full_description += f"\nh3. Standup Context\n{summary_context}\n"
-                full_description += "\n----\n_This item was generated from standup summary by AI Sprint Companion_"
-
-                ticket = JiraTicket(
-                    summary=item[:255],
-                    description=full_description,
-                    issue_type=JiraIssueType.TASK,
-                    priority="Medium",
-                    labels=["ai-generated", "standup", "action-item"],
-                )
-
-                result = await agent.create_ticket(ticket)
-                created.append(f'<a href="{result.url}" target="_blank">{result.key}</a>')
-            except JiraAgentError as e:
+            tickets.append(JiraTicket(
+                summary=item[:255],
+                description=f"h3. Action Item\n{item}\n{suffix}",
+                issue_type=JiraIssueType.TASK,
+                priority="Medium",
+                labels=["ai-generated", "standup", "action-item"],
+            ))
+
+        created = []
+        failed = []
+
+        for item, result in zip([*blockers, *action_items], await agent.create_tickets_bulk(tickets)):
+            if isinstance(result, JiraAgentError):
                 failed.append(item[:50])
+            else:
+                created.append(f'<a href="{result.url}" target="_blank">{result.key}</a>')
 
         if created and not failed:
             return HTMLResponse(
@@ -893,6 +1010,4 @@ async def htmx_create_all_standup_items(request: Request):
             return HTMLResponse(f'<span class="jira-error">❌ Failed to create tickets</span>')
     except Exception as e:
         return HTMLResponse(f'<span class="jira-error">❌ Error: {str(e)}</span>')
-    finally:
-        await agent.close()
 
@@ -9,11 +9,79 @@ Usage:
     async def main():
         client = DirectMCPClient()
         result = await client.summarize_standup([...])
+
+Run the demo with ``python -m app.mcp_client [--json]``.
 """
 
 import asyncio
-import json
-from typing import Any, Dict, List, Optional
+import sys
+import time
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import orjson
+
+try:
+    import uvloop
+except ImportError:  # Optional: faster event loop for the demo entry point
+    uvloop = None
+
+from . import __version__
+from .ai import get_ai_service
+from .config import get_settings
+from .jira_agent import JiraAgentError, JiraCreatedTicket, JiraIssueType, JiraTicket, get_jira_agent
+from .schemas import validate_standup_entries
+
+
+# Created-ticket fields returned by create_jira_ticket, read in one attrgetter
+# call instead of one attribute lookup per key of a hand-written dict literal
+_TICKET_KEYS = ("key", "id", "url", "summary")
+_TICKET_FIELDS = attrgetter(*_TICKET_KEYS)
+
+
+# Issue type names resolved with a dict hit rather than the Enum constructor
+_ISSUE_TYPE_BY_STR = {member.value: member for member in JiraIssueType}
+
+# Client methods batch() may dispatch to
+_BATCH_TOOLS = frozenset({
+    "summarize_standup",
+    "generate_user_stories",
+    "suggest_sprint_tasks",
+    "create_jira_ticket",
+    "get_jira_status",
+    "health_check",
+})
+# Default cap on batch() calls in flight, to stay under LLM and Jira rate limits
+_BATCH_CONCURRENCY = 4
+# Seconds a health_check response is reused, so probe storms return a cached dict
+_HEALTH_TTL_SECONDS = 2.0
+
+
+def _build_ticket(
+    summary: str,
+    description: str,
+    issue_type: str = "Story",
+    priority: Optional[str] = None,
+    labels: Optional[List[str]] = None,
+    story_points: Optional[int] = None,
+    acceptance_criteria: Optional[List[str]] = None
+) -> JiraTicket:
+    """Build a JiraTicket from create_jira_ticket arguments (ValueError for unknown issue types)."""
+    return JiraTicket(
+        summary=summary,
+        description=description,
+        issue_type=_ISSUE_TYPE_BY_STR.get(issue_type) or JiraIssueType(issue_type),
+        priority=priority,
+        labels=labels,
+        story_points=story_points,
+        acceptance_criteria=acceptance_criteria
+    )
+
+
+def _created_result(created: JiraCreatedTicket) -> Dict[str, Any]:
+    """Build the create_jira_ticket success result for a created ticket."""
+    return {"success": True, "ticket": dict(zip(_TICKET_KEYS, _TICKET_FIELDS(created)))}
 
 
 class DirectMCPClient:
@@ -24,18 +92,47 @@ class DirectMCPClient:
     """
 
     def __init__(self):
-        """Initialize the direct client."""
-        self.ai_service = None
-        self.jira_agent = None
-
-    async def _ensure_services(self):
-        """Ensure services are initialized."""
-        if self.ai_service is None:
-            from .ai import get_ai_service
-            self.ai_service = get_ai_service()
-        if self.jira_agent is None:
-            from .jira_agent import get_jira_agent
-            self.jira_agent = get_jira_agent()
+        """Initialize the direct client with the process-wide service singletons."""
+        self.ai_service = get_ai_service()
+        self.jira_agent = get_jira_agent()
+        self.settings = get_settings()
+        self._health_cache: Tuple[float, Optional[Dict[str, Any]]] = (0.0, None)
+
+    async def aclose(self):
+        """Close the shared AI service and Jira agent connection pools.
+
+        Both are rebuilt on next use, so this is safe to call at shutdown even
+        if other callers still hold the client.
+        """
+        await self.ai_service.close()
+        await self.jira_agent.close()
+
+    async def batch(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]],
+        concurrency: int = _BATCH_CONCURRENCY
+    ) -> List[Dict[str, Any]]:
+        """Run several independent tool calls concurrently.
+        
+        Args:
+            calls: (method name, keyword arguments) pairs, e.g.
+                ("generate_user_stories", {"notes": "..."})
+            concurrency: Max calls in flight at once
+            
+        Returns:
+            Each call's result, in the order the calls were given
+        """
+        unknown = [name for name, _ in calls if name not in _BATCH_TOOLS]
+        if unknown:
+            raise ValueError(f"Unknown tool(s): {', '.join(unknown)}")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(name: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await getattr(self, name)(**kwargs)
+
+        return list(await asyncio.gather(*(run(name, kwargs) for name, kwargs in calls)))
 
     async def summarize_standup(
         self,
@@ -56,45 +153,29 @@ class DirectMCPClient:
             Dictionary with summary, key_blockers, action_items, 
             suggested_tasks, and suggested_stories
         """
-        await self._ensure_services()
-        from .schemas import StandupEntry as SchemaStandupEntry
-
-        standup_entries = [
-            SchemaStandupEntry(
-                name=e.get("name", "Unknown"),
-                yesterday=e.get("yesterday", ""),
-                today=e.get("today", ""),
-                blockers=e.get("blockers")
-            )
-            for e in entries
-        ]
+        standup_entries = validate_standup_entries(entries)
 
         result = await self.ai_service.summarize_standup(standup_entries, sprint_goal)
+        return result.model_dump(mode="json")
+
+    async def summarize_standup_stream(
+        self,
+        entries: List[Dict[str, Any]],
+        sprint_goal: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """Stream the standup summary JSON as the model generates it.
         
-        return {
-            "summary": result.summary,
-            "key_blockers": result.key_blockers,
-            "action_items": result.action_items,
-            "suggested_tasks": [
-                {
-                    "title": t.title,
-                    "description": t.description,
-                    "estimated_hours": t.estimated_hours,
-                    "priority": t.priority,
-                    "parent_story": t.parent_story
-                }
-                for t in result.suggested_tasks
-            ] if result.suggested_tasks else [],
-            "suggested_stories": [
-                {
-                    "title": s.title,
-                    "description": s.description,
-                    "acceptance_criteria": s.acceptance_criteria,
-                    "story_points": s.story_points
-                }
-                for s in result.suggested_stories
-            ] if result.suggested_stories else []
-        }
+        Args:
+            entries: List of standup entries, as for summarize_standup
+            sprint_goal: Current sprint goal for context (optional)
+            
+        Yields:
+            Chunks of the summary JSON text as the model produces them
+        """
+        standup_entries = validate_standup_entries(entries)
+
+        async for chunk in self.ai_service.summarize_standup_stream(standup_entries, sprint_goal):
+            yield chunk
 
     async def generate_user_stories(
         self,
@@ -110,22 +191,8 @@ class DirectMCPClient:
         Returns:
             Dictionary with stories list and raw_insights
         """
-        await self._ensure_services()
-
         result = await self.ai_service.generate_user_stories(notes, context)
-        
-        return {
-            "stories": [
-                {
-                    "title": s.title,
-                    "description": s.description,
-                    "acceptance_criteria": s.acceptance_criteria,
-                    "story_points": s.story_points
-                }
-                for s in result.stories
-            ],
-            "raw_insights": result.raw_insights
-        }
+        return result.model_dump(mode="json")
 
     async def suggest_sprint_tasks(
         self,
@@ -143,28 +210,12 @@ class DirectMCPClient:
         Returns:
             Dictionary with tasks list, total_estimated_hours, and recommendations
         """
-        await self._ensure_services()
-
         result = await self.ai_service.suggest_sprint_tasks(
             user_stories=user_stories,
             team_capacity=team_capacity,
             sprint_duration_days=sprint_duration_days
         )
-        
-        return {
-            "tasks": [
-                {
-                    "title": t.title,
-                    "description": t.description,
-                    "estimated_hours": t.estimated_hours,
-                    "priority": t.priority,
-                    "parent_story": t.parent_story
-                }
-                for t in result.tasks
-            ],
-            "total_estimated_hours": result.total_estimated_hours,
-            "recommendations": result.recommendations
-        }
+        return result.model_dump(mode="json")
 
     async def create_jira_ticket(
         self,
@@ -190,9 +241,6 @@ class DirectMCPClient:
         Returns:
             Dictionary with success status and ticket details
         """
-        await self._ensure_services()
-        from .jira_agent import JiraTicket, JiraIssueType, JiraAgentError
-
         if not self.jira_agent.is_configured:
             return {
                 "error": True,
@@ -200,10 +248,10 @@ class DirectMCPClient:
             }
 
         try:
-            ticket = JiraTicket(
+            ticket = _build_ticket(
                 summary=summary,
                 description=description,
-                issue_type=JiraIssueType(issue_type),
+                issue_type=issue_type,
                 priority=priority,
                 labels=labels,
                 story_points=story_points,
@@ -212,112 +260,178 @@ class DirectMCPClient:
 
             created = await self.jira_agent.create_ticket(ticket)
             
-            return {
-                "success": True,
-                "ticket": {
-                    "key": created.key,
-                    "id": created.id,
-                    "url": created.url,
-                    "summary": created.summary
-                }
-            }
+            return _created_result(created)
         except JiraAgentError as e:
             return {"error": True, "message": str(e)}
 
+    async def create_jira_tickets_batch(self, tickets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Create several Jira tickets through the Jira bulk endpoint.
+        
+        Concurrency is bounded by the Jira agent's JIRA_MAX_CONCURRENCY.
+        
+        Args:
+            tickets: Keyword arguments for create_jira_ticket, one dict per ticket
+            
+        Returns:
+            One create_jira_ticket result per ticket, in input order; a ticket
+            with invalid arguments or rejected by Jira gets an error result instead
+        """
+        if not self.jira_agent.is_configured:
+            return [{"error": True, "message": "Jira is not configured"} for _ in tickets]
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(tickets)
+        indexes: List[int] = []
+        built: List[JiraTicket] = []
+        for index, arguments in enumerate(tickets):
+            try:
+                built.append(_build_ticket(**arguments))
+            except (TypeError, ValueError) as e:
+                results[index] = {"error": True, "message": str(e)}
+            else:
+                indexes.append(index)
+
+        created = await self.jira_agent.create_tickets_bulk(built) if built else []
+        for index, outcome in zip(indexes, created):
+            results[index] = (
+                {"error": True, "message": str(outcome)}
+                if isinstance(outcome, JiraAgentError) else _created_result(outcome)
+            )
+        return results
+
     async def get_jira_status(self) -> Dict[str, Any]:
         """Get Jira configuration status.
         
         Returns:
             Dictionary with configured status, connection info
         """
-        await self._ensure_services()
-        from .config import get_settings
-        
-        settings = get_settings()
+        configured = self.jira_agent.is_configured
         return {
-            "configured": self.jira_agent.is_configured,
-            "jira_url": settings.jira_url if self.jira_agent.is_configured else None,
-            "project_key": settings.jira_project_key if self.jira_agent.is_configured else None
+            "configured": configured,
+            "jira_url": self.settings.jira_url if configured else None,
+            "project_key": self.settings.jira_project_key if configured else None
         }
 
     async def health_check(self) -> Dict[str, Any]:
         """Check service health.
         
+        The response is reused for a couple of seconds, so configuration
+        changes may take that long to show.
+        
         Returns:
             Dictionary with status, version, ai_provider, and jira_configured
         """
-        await self._ensure_services()
-        from . import __version__
-        from .config import get_settings
-        
-        settings = get_settings()
-        return {
+        now = time.monotonic()
+        cached_at, cached = self._health_cache
+        if cached is not None and now - cached_at < _HEALTH_TTL_SECONDS:
+            return dict(cached)
+
+        result = {
             "status": "healthy",
             "version": __version__,
-            "ai_provider": settings.ai_provider,
+            "ai_provider": self.settings.ai_provider,
             "jira_configured": self.jira_agent.is_configured
         }
+        self._health_cache = (now, result)
+        return dict(result)
 
 
+@lru_cache(maxsize=1)
 def get_client() -> DirectMCPClient:
-    """Get an AI Sprint Companion client.
+    """Get the shared AI Sprint Companion client.
+    
+    Every caller gets the same instance, so Jira calls reuse one persistent
+    HTTP connection pool instead of paying for new TLS handshakes.
     
     Returns:
-        DirectMCPClient instance
+        The process-wide DirectMCPClient instance
     """
     return DirectMCPClient()
 
 
-async def demo():
-    """Demo function showing how to use the client."""
+async def aget_client() -> DirectMCPClient:
+    """Get the shared AI Sprint Companion client without blocking the event loop.
+    
+    Building the client loads settings (reading .env) and constructs the service
+    singletons, so the first call does that in a worker thread; later calls
+    return the cached client directly.
+    
+    Returns:
+        The process-wide DirectMCPClient instance
+    """
+    if get_client.cache_info().currsize:
+        return get_client()
+    return await asyncio.to_thread(get_client)
+
+
+async def demo(as_json: bool = False):
+    """Demo function showing how to use the client.
+    
+    Args:
+        as_json: Write every result to stdout as one JSON document instead of
+            the formatted walkthrough (useful when timing the client)
+    """
+    client = await aget_client()
+    
+    health = await client.health_check()
+    
+    # The remaining calls are independent, so run them together
+    standup_result, stories_result, tasks_result = await asyncio.gather(
+        client.summarize_standup([
+            {
+                "name": "Alice",
+                "yesterday": "Completed user authentication API",
+                "today": "Working on dashboard components",
+                "blockers": "Waiting for design mockups"
+            },
+            {
+                "name": "Bob",
+                "yesterday": "Fixed critical login bug",
+                "today": "Code review for Alice's PR",
+                "blockers": None
+            }
+        ], sprint_goal="Complete user authentication and dashboard MVP"),
+        client.generate_user_stories(
+            "Users need to be able to reset their passwords. The admin team wants to view all registered users."
+        ),
+        client.suggest_sprint_tasks([
+            "As a user, I want to reset my password so I can regain access to my account",
+            "As an admin, I want to view all users so I can manage the user base"
+        ]),
+    )
+    
+    if as_json:
+        report = {
+            "health": health,
+            "standup": standup_result,
+            "stories": stories_result,
+            "tasks": tasks_result,
+        }
+        sys.stdout.buffer.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+        return
+    
     print("AI Sprint Companion MCP Client Demo")
     print("=" * 50)
     
-    client = DirectMCPClient()
-    
     # Health check
     print("\n1. Health Check:")
-    health = await client.health_check()
     print(f"   Status: {health['status']}")
     print(f"   Version: {health['version']}")
     print(f"   AI Provider: {health['ai_provider']}")
     
     # Summarize standup
     print("\n2. Summarize Standup:")
-    standup_result = await client.summarize_standup([
-        {
-            "name": "Alice",
-            "yesterday": "Completed user authentication API",
-            "today": "Working on dashboard components",
-            "blockers": "Waiting for design mockups"
-        },
-        {
-            "name": "Bob",
-            "yesterday": "Fixed critical login bug",
-            "today": "Code review for Alice's PR",
-            "blockers": None
-        }
-    ], sprint_goal="Complete user authentication and dashboard MVP")
-    
     print(f"   Summary: {standup_result['summary'][:100]}...")
     print(f"   Blockers: {standup_result['key_blockers']}")
     print(f"   Tasks suggested: {len(standup_result['suggested_tasks'])}")
     
     # Generate user stories
     print("\n3. Generate User Stories:")
-    stories_result = await client.generate_user_stories(
-        "Users need to be able to reset their passwords. The admin team wants to view all registered users."
-    )
     print(f"   Stories generated: {len(stories_result['stories'])}")
     for story in stories_result['stories'][:2]:
         print(f"   - {story['title']}")
     
     # Suggest tasks
     print("\n4. Suggest Sprint Tasks:")
-    tasks_result = await client.suggest_sprint_tasks([
-        "As a user, I want to reset my password so I can regain access to my account",
-        "As an admin, I want to view all users so I can manage the user base"
-    ])
     print(f"   Tasks suggested: {len(tasks_result['tasks'])}")
     print(f"   Total hours: {tasks_result['total_estimated_hours']}")
     
@@ -326,5 +440,7 @@ async def demo():
 
 
 if __name__ == "__main__":
-    asyncio.run(demo())
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(demo(as_json="--json" in sys.argv[1:]))
 
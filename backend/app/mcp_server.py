@@ -12,10 +12,8 @@ MCP Server provides the following tools:
 """
 
 import asyncio
-import json
 import sys
-from typing import Any, Dict, List, Optional, Sequence
-from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional
 
 # MCP SDK imports
 try:
@@ -36,7 +34,7 @@ except ImportError:
 
 from .ai import AIService, get_ai_service
 from .jira_agent import JiraAgent, JiraTicket, JiraIssueType, JiraAgentError, get_jira_agent
-from .schemas import StandupEntry
+from .schemas import to_json_bytes, validate_standup_entries
 
 
 class MCPSprintCompanionServer:
@@ -212,14 +210,14 @@ class MCPSprintCompanionServer:
             """Handle tool calls."""
             try:
                 result = await self._execute_tool(name, arguments)
-                return [TextContent(type="text", text=json.dumps(result, indent=2, default=str))]
+                return [TextContent(type="text", text=to_json_bytes(result).decode())]
             except Exception as e:
                 error_result = {
                     "error": True,
                     "message": str(e),
                     "tool": name
                 }
-                return [TextContent(type="text", text=json.dumps(error_result, indent=2))]
+                return [TextContent(type="text", text=to_json_bytes(error_result).decode())]
 
     async def _execute_tool(self, name: str, arguments: dict) -> Dict[str, Any]:
         """Execute a tool and return the result."""
@@ -251,45 +249,14 @@ class MCPSprintCompanionServer:
         entries_data = arguments.get("entries", [])
         sprint_goal = arguments.get("sprint_goal")
 
-        entries = [
-            StandupEntry(
-                name=e.get("name", "Unknown"),
-                yesterday=e.get("yesterday", ""),
-                today=e.get("today", ""),
-                blockers=e.get("blockers")
-            )
-            for e in entries_data
-        ]
+        entries = validate_standup_entries(entries_data)
 
         if not entries:
             return {"error": True, "message": "No standup entries provided"}
 
         result = await self.ai_service.summarize_standup(entries, sprint_goal)
 
-        return {
-            "summary": result.summary,
-            "key_blockers": result.key_blockers,
-            "action_items": result.action_items,
-            "suggested_tasks": [
-                {
-                    "title": t.title,
-                    "description": t.description,
-                    "estimated_hours": t.estimated_hours,
-                    "priority": t.priority,
-                    "parent_story": t.parent_story
-                }
-                for t in result.suggested_tasks
-            ],
-            "suggested_stories": [
-                {
-                    "title": s.title,
-                    "description": s.description,
-                    "acceptance_criteria": s.acceptance_criteria,
-                    "story_points": s.story_points
-                }
-                for s in result.suggested_stories
-            ]
-        }
+        return result.model_dump(mode="json")
 
     async def _generate_user_stories(self, arguments: dict) -> Dict[str, Any]:
         """Generate user stories from meeting notes."""
@@ -301,18 +268,7 @@ class MCPSprintCompanionServer:
 
         result = await self.ai_service.generate_user_stories(notes, context)
 
-        return {
-            "stories": [
-                {
-                    "title": s.title,
-                    "description": s.description,
-                    "acceptance_criteria": s.acceptance_criteria,
-                    "story_points": s.story_points
-                }
-                for s in result.stories
-            ],
-            "raw_insights": result.raw_insights
-        }
+        return result.model_dump(mode="json")
 
     async def _suggest_sprint_tasks(self, arguments: dict) -> Dict[str, Any]:
         """Suggest sprint tasks from user stories."""
@@ -329,20 +285,7 @@ class MCPSprintCompanionServer:
             sprint_duration_days=sprint_duration_days
         )
 
-        return {
-            "tasks": [
-                {
-                    "title": t.title,
-                    "description": t.description,
-                    "estimated_hours": t.estimated_hours,
-                    "priority": t.priority,
-                    "parent_story": t.parent_story
-                }
-                for t in result.tasks
-            ],
-            "total_estimated_hours": result.total_estimated_hours,
-            "recommendations": result.recommendations
-        }
+        return result.model_dump(mode="json")
 
     async def _create_jira_ticket(self, arguments: dict) -> Dict[str, Any]:
         """Create a Jira ticket."""
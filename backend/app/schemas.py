@@ -1,7 +1,8 @@
 """Pydantic schemas for request/response validation."""
-from typing import List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field
+import orjson
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 # ============================================================================
@@ -105,6 +106,26 @@ class JiraConfigStatus(BaseModel):
     user_email: Optional[str] = Field(None, description="Connected user email")
 
 
+class JiraUserInfo(BaseModel):
+    """Jira user returned by a connection test."""
+    displayName: Optional[str] = Field(None, description="User display name")
+    emailAddress: Optional[str] = Field(None, description="User email address")
+
+
+class JiraProjectInfo(BaseModel):
+    """Jira project returned by a connection test."""
+    key: Optional[str] = Field(None, description="Project key")
+    name: Optional[str] = Field(None, description="Project name")
+
+
+class JiraConnectionTestResponse(BaseModel):
+    """Result of testing the Jira connection."""
+    success: bool = Field(..., description="Whether Jira could be reached")
+    user: Optional[JiraUserInfo] = Field(None, description="Authenticated user")
+    project: Optional[JiraProjectInfo] = Field(None, description="Configured project")
+    error: Optional[str] = Field(None, description="Error message if failed")
+
+
 class JiraTicketRequest(BaseModel):
     """Request to create a Jira ticket."""
     summary: str = Field(..., min_length=1, max_length=255, description="Ticket summary/title")
@@ -126,7 +147,7 @@ class JiraTicketResponse(BaseModel):
 
 class JiraBulkCreateRequest(BaseModel):
     """Request to create multiple Jira tickets."""
-    tickets: List[JiraTicketRequest] = Field(..., min_length=1, description="List of tickets to create")
+    tickets: List[JiraTicketRequest] = Field(..., min_length=1, max_length=100, description="List of tickets to create")
 
 
 class JiraBulkCreateResponse(BaseModel):
@@ -136,3 +157,34 @@ class JiraBulkCreateResponse(BaseModel):
     failed: List[JiraTicketResponse] = Field(default_factory=list, description="Failed tickets")
     total_created: int = Field(default=0, description="Number of tickets created")
     total_failed: int = Field(default=0, description="Number of tickets that failed")
+
+
+# ============================================================================
+# MCP Tool Helpers
+# ============================================================================
+
+class _ToolStandupEntry(StandupEntry):
+    """Standup entry with the MCP tools' defaults for missing keys."""
+    name: str = "Unknown"
+    yesterday: str = ""
+    today: str = ""
+
+
+# Validates a whole entry list in one pydantic-core call
+_STANDUP_ENTRIES = TypeAdapter(List[_ToolStandupEntry])
+
+
+def validate_standup_entries(entries: List[Dict[str, Any]]) -> List[StandupEntry]:
+    """Validate raw standup entry dicts, defaulting missing name/yesterday/today.
+
+    The API request schema keeps those fields required; tool callers may omit them.
+    """
+    return _STANDUP_ENTRIES.validate_python(entries)
+
+
+def to_json_bytes(result: Dict[str, Any]) -> bytes:
+    """Serialize a tool result to indented JSON with orjson.
+
+    Values orjson cannot serialize natively fall back to their string form.
+    """
+    return orjson.dumps(result, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
@@ -33,6 +33,8 @@ Author: AI Sprint Companion Team
 import os
 import json
 import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 # Force mock mode for tests
 os.environ["AI_PROVIDER"] = "mock"
@@ -108,8 +110,8 @@ class TestAIServiceClientSetup:
 
         Verifies the configured OpenAI model name is returned.
         """
-        service = AIService()
-        service.settings.ai_provider = "mock"
+        from app.config import Settings
+        service = AIService(settings=Settings(ai_provider="mock"))
 
         model = service._get_model()
         assert model == service.settings.openai_model
@@ -120,8 +122,8 @@ class TestAIServiceClientSetup:
 
         Verifies Azure deployment name is used instead of model name.
         """
-        service = AIService()
-        service.settings.ai_provider = "azure"
+        from app.config import Settings
+        service = AIService(settings=Settings(ai_provider="azure"))
 
         model = service._get_model()
         assert model == service.settings.azure_openai_deployment
@@ -490,6 +492,23 @@ class TestAIServiceMainMethods:
 
         assert result.stories
 
+    @pytest.mark.asyncio
+    async def test_stream_user_stories(self, service):
+        """
+        Test stream_user_stories yields one response per set of notes.
+
+        Verifies every completed generation is streamed back.
+        """
+        notes_list = [
+            "Users need password reset functionality",
+            "Admin team wants a user management dashboard",
+        ]
+
+        results = [result async for result in service.stream_user_stories(notes_list)]
+
+        assert len(results) == 2
+        assert all(result.stories for result in results)
+
     @pytest.mark.asyncio
     async def test_suggest_sprint_tasks(self, service):
         """
@@ -526,6 +545,42 @@ class TestAIServiceMainMethods:
 
         assert result.tasks
 
+    def test_parse_tasks_response_totals_hours_locally(self, service):
+        """
+        Test the task total is recomputed from the per-task estimates.
+
+        Verifies a mis-added total from the model is replaced.
+        """
+        response = json.dumps({
+            "tasks": [
+                {"title": "A", "description": "a", "estimated_hours": 1.5},
+                {"title": "B", "description": "b", "estimated_hours": 2},
+            ],
+            "total_estimated_hours": 10,
+        })
+
+        result = service._parse_tasks_response(response)
+
+        assert result.total_estimated_hours == 3.5
+
+    def test_parse_tasks_response_keeps_total_with_missing_estimates(self, service):
+        """
+        Test the model's total is kept when any task lacks an estimate.
+
+        Verifies a partial sum never replaces the reported total.
+        """
+        response = json.dumps({
+            "tasks": [
+                {"title": "A", "description": "a", "estimated_hours": 1.5},
+                {"title": "B", "description": "b"},
+            ],
+            "total_estimated_hours": 10,
+        })
+
+        result = service._parse_tasks_response(response)
+
+        assert result.total_estimated_hours == 10
+
     @pytest.mark.asyncio
     async def test_chat_completion_mock(self, service):
         """
@@ -543,6 +598,121 @@ class TestAIServiceMainMethods:
         assert result is not None
         assert isinstance(result, str)
 
+    @pytest.mark.asyncio
+    async def test_batch_chat_preserves_order(self, service):
+        """
+        Test batch_chat runs several prompts and keeps input order.
+
+        Verifies each prompt gets its own response in the same position.
+        """
+        prompts = [
+            [{"role": "system", "content": "You are a technical lead."},
+             {"role": "user", "content": "- As a user, I want to login"}],
+            [{"role": "system", "content": "You are an Agile coach. Extract user stories"},
+             {"role": "user", "content": "Users need password reset"}],
+        ]
+
+        results = await service.batch_chat(prompts)
+
+        assert len(results) == 2
+        assert "tasks" in json.loads(results[0])
+        assert "stories" in json.loads(results[1])
+
+    @pytest.mark.asyncio
+    async def test_suggest_sprint_tasks_batch_mock(self, service):
+        """
+        Test suggest_sprint_tasks_batch without a provider.
+
+        Verifies one response is returned per story list.
+        """
+        results = await service.suggest_sprint_tasks_batch([
+            ["As a user, I want to login"],
+            ["As an admin, I want to manage users"],
+        ])
+
+        assert len(results) == 2
+        assert all(result.tasks for result in results)
+
+    @pytest.mark.asyncio
+    async def test_batch_api_round_trip(self, service):
+        """
+        Test submit_batch and wait_for_batch against a mocked client.
+
+        Verifies output lines are mapped back to request order.
+        """
+        output_lines = [
+            {"custom_id": f"request-{i}",
+             "response": {"body": {"choices": [{"message": {"content": f"answer {i}"}}]}}}
+            for i in (1, 0)
+        ]
+        client = MagicMock()
+        client.files.create = AsyncMock(return_value=SimpleNamespace(id="file-in"))
+        client.batches.create = AsyncMock(return_value=SimpleNamespace(id="batch-1"))
+        client.batches.retrieve = AsyncMock(return_value=SimpleNamespace(
+            status="completed",
+            output_file_id="file-out",
+            request_counts=SimpleNamespace(total=2),
+        ))
+        client.files.content = AsyncMock(return_value=SimpleNamespace(
+            text="\n".join(json.dumps(line) for line in output_lines)
+        ))
+        service._client = client
+
+        batch_id = await service.submit_batch([
+            [{"role": "user", "content": "first"}],
+            [{"role": "user", "content": "second"}],
+        ])
+        results = await service.wait_for_batch(batch_id)
+
+        assert batch_id == "batch-1"
+        assert results == ["answer 0", "answer 1"]
+
+    @pytest.mark.asyncio
+    async def test_chat_completion_fast_path(self):
+        """
+        Test _chat_completion posts directly when AI_FAST_PATH is enabled.
+
+        Verifies the REST response content is returned without the SDK.
+        """
+        from app.config import Settings
+        service = AIService(settings=Settings(
+            ai_provider="openai", openai_api_key="sk-test", ai_fast_path=True
+        ))
+
+        response = MagicMock()
+        response.raise_for_status = MagicMock()
+        response.json = AsyncMock(return_value={"choices": [{"message": {"content": "fast"}}]})
+        post_ctx = MagicMock()
+        post_ctx.__aenter__ = AsyncMock(return_value=response)
+        post_ctx.__aexit__ = AsyncMock(return_value=False)
+        session = MagicMock(closed=False)
+        session.post = MagicMock(return_value=post_ctx)
+        service._http_session = session
+
+        result = await service._chat_completion([{"role": "user", "content": "hi"}])
+
+        assert result == "fast"
+        assert session.post.call_args.args[0].endswith("/chat/completions")
+
+    @pytest.mark.asyncio
+    async def test_chat_completion_json_mode(self, service):
+        """
+        Test json_mode requests a JSON object response format.
+
+        Verifies response_format is forwarded to the provider client.
+        """
+        completion = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="{}"))]
+        )
+        client = MagicMock()
+        client.chat.completions.create = AsyncMock(return_value=completion)
+        service._client = client
+
+        await service._chat_completion([{"role": "user", "content": "JSON"}], json_mode=True)
+
+        kwargs = client.chat.completions.create.call_args.kwargs
+        assert kwargs["response_format"] == {"type": "json_object"}
+
 
 class TestAIServiceEdgeCases:
     """
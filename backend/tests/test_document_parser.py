@@ -26,6 +26,8 @@ Author: AI Sprint Companion Team
 """
 
 import io
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from fastapi import UploadFile
@@ -34,6 +36,7 @@ from app.document_parser import (
     extract_text_from_file,
     extract_from_txt,
     extract_from_pdf,
+    extract_from_pdf_async,
     extract_from_docx,
     extract_from_doc,
 )
@@ -128,6 +131,39 @@ class TestExtractFromPdf:
             result = extract_from_pdf(b"fake content")
             assert result is not None
 
+    @pytest.mark.asyncio
+    async def test_extract_pdf_async_small_document(self):
+        """
+        Test async PDF extraction for documents below the parallel threshold.
+
+        Verifies small PDFs are parsed in a thread without starting the pool.
+        """
+        with patch('app.document_parser.pymupdf', MagicMock()), \
+                patch('app.document_parser._pdf_page_count', return_value=1), \
+                patch('app.document_parser.extract_from_pdf', return_value="Page 1 content"), \
+                patch('app.document_parser._get_pdf_pool') as mock_pool:
+            result = await extract_from_pdf_async(b"fake content")
+
+        assert result == "Page 1 content"
+        mock_pool.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_extract_pdf_async_pypdf2_uses_worker_process(self):
+        """
+        Test async PDF extraction without PyMuPDF.
+
+        Verifies the pure-Python PyPDF2 parser runs in the worker pool.
+        """
+        with ThreadPoolExecutor(max_workers=1) as pool, \
+                patch('app.document_parser.pymupdf', None), \
+                patch('app.document_parser.PdfReader', MagicMock()), \
+                patch('app.document_parser._extract_from_pdf_pypdf2', return_value="PyPDF2 text"), \
+                patch('app.document_parser._get_pdf_pool', return_value=pool) as mock_pool:
+            result = await extract_from_pdf_async(b"fake content")
+
+        assert result == "PyPDF2 text"
+        mock_pool.assert_called_once()
+
 
 class TestExtractFromDocx:
     """
@@ -204,6 +240,16 @@ class TestExtractFromDoc:
         result = extract_from_doc(content)
         assert "readable" in result or "limited support" in result.lower()
 
+    def test_extract_doc_binary_prefix_skips_full_scan(self):
+        """
+        Test DOC extraction gives up when the leading bytes are binary.
+
+        Verifies text past the sniffed prefix does not trigger a full decode.
+        """
+        content = bytes(8192) + b"Readable text that only appears after the binary header." * 2
+        result = extract_from_doc(content)
+        assert "limited support" in result
+
     def test_extract_doc_binary_content(self):
         """
         Test DOC extraction with mostly binary content.
@@ -340,6 +386,100 @@ class TestExtractTextFromFile:
         result = await extract_text_from_file(mock_file)
         assert result is not None
 
+    @pytest.mark.asyncio
+    async def test_extract_rejects_oversize_file(self):
+        """
+        Test extraction returns None for uploads over the size limit.
+
+        Verifies the read is bounded to one byte past the configured limit.
+        """
+        mock_file = AsyncMock(spec=UploadFile)
+        mock_file.filename = "big.txt"
+        mock_file.read = AsyncMock(return_value=b"x" * 11)
+
+        with patch('app.document_parser.get_settings') as mock_settings:
+            mock_settings.return_value.max_upload_bytes = 10
+            result = await extract_text_from_file(mock_file)
+
+        assert result is None
+        mock_file.read.assert_awaited_once_with(11)
+
+    @pytest.mark.asyncio
+    async def test_extract_dispatches_on_magic_bytes(self):
+        """
+        Test a PDF uploaded under the wrong extension is parsed as a PDF.
+
+        Verifies the leading magic bytes take precedence over the filename.
+        """
+        mock_file = AsyncMock(spec=UploadFile)
+        mock_file.filename = "notes.txt"
+        mock_file.read = AsyncMock(return_value=b"%PDF-1.7 fake pdf content")
+        mock_file.seek = AsyncMock()
+
+        with patch('app.document_parser.extract_from_pdf_async',
+                   AsyncMock(return_value="PDF text")) as mock_pdf:
+            result = await extract_text_from_file(mock_file)
+
+        assert result == "PDF text"
+        mock_pdf.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("filename", ["sheet.xlsx", "deck.pptx", "archive.zip"])
+    async def test_extract_rejects_unsupported_zip_formats(self, filename):
+        """
+        Test ZIP uploads with unsupported extensions are rejected.
+
+        Verifies the ZIP signature alone does not route a file to the DOCX parser.
+        """
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as archive:
+            archive.writestr("[Content_Types].xml", "<Types/>")
+        mock_file = AsyncMock(spec=UploadFile)
+        mock_file.filename = filename
+        mock_file.read = AsyncMock(return_value=buffer.getvalue())
+
+        with patch('app.document_parser.extract_from_docx') as mock_docx:
+            result = await extract_text_from_file(mock_file)
+
+        assert result is None
+        mock_docx.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_extract_ignores_zip_signature_without_word_document(self):
+        """
+        Test a non-Word ZIP renamed to .txt is not sent to the DOCX parser.
+
+        Verifies the ZIP signature only counts as DOCX with a word/document.xml member.
+        """
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as archive:
+            archive.writestr("xl/workbook.xml", "<workbook/>")
+        mock_file = AsyncMock(spec=UploadFile)
+        mock_file.filename = "notes.txt"
+        mock_file.read = AsyncMock(return_value=buffer.getvalue())
+
+        with patch('app.document_parser.extract_from_docx') as mock_docx, \
+                patch('app.document_parser.extract_from_txt', return_value="text") as mock_txt:
+            result = await extract_text_from_file(mock_file)
+
+        assert result == "text"
+        mock_docx.assert_not_called()
+        mock_txt.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_extract_rejects_ole2_with_unsupported_extension(self):
+        """
+        Test legacy Office files other than .doc are rejected.
+
+        Verifies an OLE2 signature does not route .xls uploads to the DOC filter.
+        """
+        mock_file = AsyncMock(spec=UploadFile)
+        mock_file.filename = "sheet.xls"
+        mock_file.read = AsyncMock(return_value=b"\xd0\xcf\x11\xe0" + b"binary" * 20)
+
+        result = await extract_text_from_file(mock_file)
+        assert result is None
+
     @pytest.mark.asyncio
     async def test_extract_handles_exception(self):
         """
@@ -27,6 +27,7 @@ Usage:
 Author: AI Sprint Companion Team
 """
 
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
@@ -375,6 +376,131 @@ class TestJiraAgent:
             result = await agent.get_issue_types()
             assert len(result) == 3
 
+    @pytest.mark.asyncio
+    async def test_create_tickets_batch_partial_failure(self):
+        """
+        Test batch creation keeps ticket order and skips failed tickets.
+
+        Verifies concurrent creates return successes in input order.
+        """
+        agent = JiraAgent(
+            jira_url="https://test.atlassian.net",
+            email="test@example.com",
+            api_token="token123",
+            project_key="TEST"
+        )
+
+        async def fake_create(ticket):
+            if ticket.summary == "Bad":
+                raise JiraAgentError("rejected")
+            return JiraCreatedTicket(
+                key=f"TEST-{ticket.summary}", id="1",
+                url="https://test.atlassian.net/browse/x", summary=ticket.summary,
+            )
+
+        tickets = [JiraTicket(summary=s, description="d") for s in ("1", "Bad", "2")]
+        with patch.object(agent, '_create_ticket', side_effect=fake_create):
+            created = await agent.create_tickets_batch(tickets)
+
+        assert [t.key for t in created] == ["TEST-1", "TEST-2"]
+
+    @pytest.mark.asyncio
+    async def test_create_ticket_not_blocked_by_bulk_work(self):
+        """
+        Test single-ticket creates use their own concurrency slots.
+
+        Verifies create_ticket completes while every bulk slot is taken.
+        """
+        agent = JiraAgent(
+            jira_url="https://test.atlassian.net",
+            email="test@example.com",
+            api_token="token123",
+            project_key="TEST"
+        )
+        created = JiraCreatedTicket(
+            key="TEST-1", id="1", url="https://test.atlassian.net/browse/TEST-1", summary="Urgent",
+        )
+
+        for _ in range(agent._bulk_semaphore._value):
+            await agent._bulk_semaphore.acquire()
+
+        with patch.object(agent, '_create_ticket', AsyncMock(return_value=created)):
+            result = await asyncio.wait_for(
+                agent.create_ticket(JiraTicket(summary="Urgent", description="d")), timeout=1
+            )
+
+        assert result.key == "TEST-1"
+        assert agent._bulk_semaphore.locked()
+
+    @pytest.mark.asyncio
+    async def test_create_tickets_bulk_maps_results(self):
+        """
+        Test bulk creation maps created issues and element errors back to tickets.
+
+        Verifies failed elements are reported by index and the remaining
+        tickets receive the created issues in order.
+        """
+        agent = JiraAgent(
+            jira_url="https://test.atlassian.net",
+            email="test@example.com",
+            api_token="token123",
+            project_key="TEST"
+        )
+
+        mock_response = MagicMock()
+        mock_response.status_code = 201
+        mock_response.content = (
+            b'{"issues": [{"id": "1", "key": "TEST-1"}, {"id": "3", "key": "TEST-3"}],'
+            b' "errors": [{"status": 400, "failedElementNumber": 1,'
+            b' "elementErrors": {"errorMessages": ["Summary required"]}}]}'
+        )
+
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(return_value=mock_response)
+
+        tickets = [JiraTicket(summary=s, description="d") for s in ("A", "B", "C")]
+        with patch.object(agent, '_get_client', return_value=mock_client), \
+                patch.object(agent, '_get_issue_type_id', AsyncMock(return_value="10001")):
+            results = await agent.create_tickets_bulk(tickets)
+
+        assert results[0].key == "TEST-1"
+        assert isinstance(results[1], JiraAgentError)
+        assert "Summary required" in str(results[1])
+        assert results[2].key == "TEST-3"
+        assert mock_client.post.call_args.args[0] == "/issue/bulk"
+
+    @pytest.mark.asyncio
+    async def test_issue_type_id_uses_shared_cache(self):
+        """
+        Test issue type IDs are shared across agents for the same project.
+
+        Verifies a second agent resolves issue types without another request.
+        """
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "issueTypes": [{"id": "1", "name": "Story"}, {"id": "2", "name": "Task"}]
+        }
+
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(return_value=mock_response)
+
+        agents = [
+            JiraAgent(
+                jira_url="https://cache.atlassian.net",
+                email="test@example.com",
+                api_token="token123",
+                project_key="CACHE"
+            )
+            for _ in range(2)
+        ]
+
+        for agent in agents:
+            with patch.object(agent, '_get_client', return_value=mock_client):
+                assert await agent._get_issue_type_id(JiraIssueType.TASK) == "2"
+
+        mock_client.get.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_close_client(self):
         """
@@ -454,6 +580,28 @@ class TestJiraAgent:
         assert result["version"] == 1
         assert len(result["content"]) > 0
 
+    def test_format_description_bullets_in_place(self):
+        """
+        Test bullet lists are emitted where they appear in the description.
+
+        Verifies consecutive bullets become one list ahead of later paragraphs.
+        """
+        agent = JiraAgent(
+            jira_url="https://test.atlassian.net",
+            email="test@example.com",
+            api_token="token123",
+            project_key="TEST"
+        )
+
+        ticket = JiraTicket(
+            summary="Test",
+            description="h3. Header\n* Bullet 1\n* Bullet 2\nTrailing text"
+        )
+
+        content = agent._format_description(ticket)["content"]
+        assert [node["type"] for node in content] == ["heading", "bulletList", "paragraph"]
+        assert len(content[1]["content"]) == 2
+
     def test_format_description_empty(self):
         """
         Test description formatting with empty content.
@@ -473,6 +621,27 @@ class TestJiraAgent:
         result = agent._format_description(ticket)
         assert result["type"] == "doc"
 
+    def test_format_description_empty_builds_fresh_content(self):
+        """
+        Test the empty-description fallback is built fresh for every payload.
+
+        Verifies editing one payload's nodes leaves the next payload untouched.
+        """
+        agent = JiraAgent(
+            jira_url="https://test.atlassian.net",
+            email="test@example.com",
+            api_token="token123",
+            project_key="TEST"
+        )
+
+        ticket = JiraTicket(summary="Test", description="")
+
+        first = agent._format_description(ticket)
+        first["content"][0]["content"][0]["text"] = "Edited"
+        second = agent._format_description(ticket)
+
+        assert second["content"][0]["content"][0]["text"] == "No description provided."
+
     def test_parse_text_with_formatting(self):
         """
         Test parsing text with bold markers for ADF.
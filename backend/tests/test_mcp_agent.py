@@ -31,11 +31,26 @@ Usage:
 Author: AI Sprint Companion Team
 """
 
+import asyncio
+import json
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
 
-from app.mcp_agent_test import MCPAgentTester
+from app.mcp_agent_test import MCPAgentTester, _serialize_report
+from app.mcp_client import get_client
+
+
+@pytest.fixture(autouse=True)
+def fresh_client():
+    """
+    Reset the shared MCP client around each test.
+
+    Tests patch methods on tester.client, which is the process-wide singleton.
+    """
+    get_client.cache_clear()
+    yield
+    get_client.cache_clear()
 
 
 class TestMCPAgentTester:
@@ -145,6 +160,72 @@ class TestMCPAgentTester:
         assert len(tester.test_results) == 1
         assert tester.test_results[0]["success"] is False
 
+    def test_record_test_quiet_keeps_details(self, tester, capsys):
+        """
+        Test _record_test at verbosity 0.
+
+        Verifies pass details and data are still recorded but not printed,
+        and INFO logs are dropped.
+        """
+        tester.verbosity = 0
+
+        tester._record_test("passing", True, "All good", {"key": "value"})
+        tester._log("Chatter", "INFO")
+
+        assert tester.test_results[0]["details"] == "All good"
+        assert tester.test_results[0]["data"] == {"key": "value"}
+        out = capsys.readouterr().out
+        assert "PASS: passing" in out
+        assert "All good" not in out
+        assert "Chatter" not in out
+
+    @pytest.mark.asyncio
+    async def test_record_test_writes_ndjson(self, tmp_path):
+        """
+        Test results are streamed to the NDJSON file as they are recorded.
+
+        Verifies one JSON line per result and the running pass/fail counters.
+        """
+        path = tmp_path / "results.ndjson"
+        tester = MCPAgentTester(results_path=str(path))
+        await tester.initialize()
+
+        tester._record_test("first", True, "ok")
+        tester._record_test("second", False, "broken")
+        await tester.aclose()
+
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [line["test"] for line in lines] == ["first", "second"]
+        assert (tester.passed, tester.failed) == (1, 1)
+
+    def test_serialize_report_json(self):
+        """
+        The final report serializes to newline-terminated JSON by default.
+
+        Verifies non-JSON values fall back to their string form.
+        """
+        report = {"success": True, "results": [{"test": "t", "data": datetime(2026, 1, 1)}]}
+
+        payload = _serialize_report(report, "json")
+
+        assert payload.endswith(b"\n")
+        assert json.loads(payload)["results"][0]["test"] == "t"
+
+    @pytest.mark.asyncio
+    async def test_call_retries_connection_errors(self, tester):
+        """
+        Test _call retries a tool call that times out.
+
+        Verifies the call is retried and its eventual result returned.
+        """
+        call = AsyncMock(side_effect=[asyncio.TimeoutError(), {"configured": False}])
+
+        with patch("app.mcp_agent_test._CALL_BACKOFF_SECONDS", 0):
+            result = await tester._call(call)
+
+        assert result == {"configured": False}
+        assert call.await_count == 2
+
     @pytest.mark.asyncio
     async def test_initialize_success(self, tester):
         """
@@ -155,9 +236,22 @@ class TestMCPAgentTester:
         result = await tester.initialize()
 
         assert result is True
-        assert tester.client is not None
+        assert tester.client is get_client()
         assert tester.start_time is not None
 
+    @pytest.mark.asyncio
+    async def test_aclose_closes_shared_services(self, tester):
+        """
+        Test aclose releases the services the client reused across tests.
+
+        Verifies the shared client is closed once.
+        """
+        tester.client = MagicMock(aclose=AsyncMock())
+
+        await tester.aclose()
+
+        tester.client.aclose.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_test_health_check(self, tester):
         """
@@ -252,6 +346,103 @@ class TestMCPAgentTester:
         assert "duration_seconds" in results
         assert results["tests_run"] > 0
 
+    @pytest.mark.asyncio
+    async def test_run_all_tests_end_to_end_runs_last(self, tester):
+        """
+        Test the end-to-end workflow runs after the concurrent tests.
+
+        Verifies every independent test has finished before the workflow starts.
+        """
+        finished = []
+
+        def make_test(name):
+            async def run():
+                await asyncio.sleep(0)
+                finished.append(name)
+                return True
+            return run
+
+        for name in ("test_health_check", "test_summarize_standup", "test_generate_user_stories",
+                     "test_suggest_sprint_tasks", "test_jira_status", "test_with_sample_file",
+                     "test_end_to_end_workflow"):
+            setattr(tester, name, make_test(name))
+
+        await tester.run_all_tests()
+
+        assert len(finished) == 7
+        assert finished[-1] == "test_end_to_end_workflow"
+
+    @pytest.mark.asyncio
+    async def test_run_all_tests_only_and_skip(self, tester):
+        """
+        Test run_all_tests runs just the selected tests.
+
+        Verifies only-listed tests run and skipped ones are left out.
+        """
+        results = await tester.run_all_tests(
+            only={"health_check", "get_jira_status", "end_to_end_workflow"},
+            skip={"end_to_end_workflow"},
+        )
+
+        assert sorted(r["test"] for r in results["results"]) == ["get_jira_status", "health_check"]
+
+    @pytest.mark.asyncio
+    async def test_run_all_tests_without_results(self, tester):
+        """
+        Test run_all_tests can return just the counts.
+
+        Verifies the per-test rows are left out when not requested.
+        """
+        results = await tester.run_all_tests(only={"get_jira_status"}, include_results=False)
+
+        assert "results" not in results
+        assert (results["tests_run"], results["tests_passed"]) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_run_all_tests_fail_fast_cancels_siblings(self, tester):
+        """
+        Test fail-fast mode stops the run at the first failure.
+
+        Verifies tests still in flight are cancelled and the workflow never starts.
+        """
+        tester.fail_fast = True
+        started = []
+
+        async def fail():
+            tester._record_test("health_check", False, "broken")
+            return False
+
+        async def hang(name):
+            started.append(name)
+            await asyncio.sleep(60)
+            return True
+
+        tester.test_health_check = fail
+        for name in ("test_summarize_standup", "test_generate_user_stories", "test_suggest_sprint_tasks",
+                     "test_jira_status", "test_with_sample_file", "test_end_to_end_workflow"):
+            setattr(tester, name, lambda name=name: hang(name))
+
+        results = await asyncio.wait_for(tester.run_all_tests(), timeout=5)
+
+        assert results["success"] is False
+        assert "test_end_to_end_workflow" not in started
+
+    @pytest.mark.asyncio
+    async def test_run_all_tests_records_timeout(self, tester):
+        """
+        Test a hung test is recorded as failed once it exceeds the time limit.
+        """
+        async def hang():
+            await asyncio.sleep(60)
+
+        tester.test_jira_status = hang
+
+        with patch("app.mcp_agent_test._TEST_TIMEOUT_SECONDS", 0.01):
+            results = await tester.run_all_tests()
+
+        timed_out = [r for r in results["results"] if r["test"] == "get_jira_status"]
+        assert timed_out[0]["details"].startswith("Timed out")
+
     @pytest.mark.asyncio
     async def test_test_with_sample_file_missing(self, tester):
         """
@@ -261,9 +452,9 @@ class TestMCPAgentTester:
         """
         await tester.initialize()
 
-        with patch('os.path.exists', return_value=False):
+        with patch('app.mcp_agent_test._sample_stat', return_value=None):
             result = await tester.test_with_sample_file()
-            assert isinstance(result, bool)
+            assert result is False
 
 
 class TestMCPAgentTesterErrorHandling:
@@ -296,6 +487,20 @@ class TestMCPAgentTesterErrorHandling:
         result = await tester.test_health_check()
         assert result is False
 
+    @pytest.mark.asyncio
+    async def test_health_check_unhealthy_status(self, tester):
+        """
+        Test health check fails when the service reports an unhealthy status.
+
+        Verifies the reported status is checked, not just that the call returned.
+        """
+        await tester.initialize()
+        tester.client.health_check = AsyncMock(return_value={"status": "degraded"})
+
+        result = await tester.test_health_check()
+
+        assert result is False
+
     @pytest.mark.asyncio
     async def test_summarize_standup_exception(self, tester):
         """
@@ -380,6 +585,8 @@ class TestMCPAgentTesterResultFormats:
 
         result = await tester.test_summarize_standup()
         assert result is False
+        assert "key_blockers: Field required" in tester.test_results[0]["details"]
+        assert {e["loc"][0] for e in tester.test_results[0]["data"]} >= {"key_blockers", "suggested_stories"}
 
     @pytest.mark.asyncio
     async def test_stories_empty_result(self, tester):
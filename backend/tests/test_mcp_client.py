@@ -27,10 +27,15 @@ Usage:
 Author: AI Sprint Companion Team
 """
 
+import asyncio
+import json
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from app.mcp_client import DirectMCPClient, get_client
+from app.mcp_client import DirectMCPClient, aget_client, get_client
+from app.jira_agent import JiraAgentError, JiraCreatedTicket
+from app.schemas import StandupSummaryResponse
 
 
 class TestDirectMCPClient:
@@ -67,6 +72,21 @@ class TestDirectMCPClient:
         assert "jira_configured" in result
         assert result["status"] == "healthy"
 
+    @pytest.mark.asyncio
+    async def test_health_check_cached_briefly(self, client):
+        """
+        Test repeated health checks reuse the recent response.
+
+        Verifies a configuration change shows only once the TTL has passed.
+        """
+        client.jira_agent = MagicMock(is_configured=False)
+        first = await client.health_check()
+        client.jira_agent.is_configured = True
+
+        assert (await client.health_check()) == first
+        with patch("app.mcp_client._HEALTH_TTL_SECONDS", 0):
+            assert (await client.health_check())["jira_configured"] is True
+
     @pytest.mark.asyncio
     async def test_summarize_standup(self, client):
         """
@@ -113,6 +133,35 @@ class TestDirectMCPClient:
         assert "summary" in result
         assert isinstance(result["suggested_tasks"], list)
 
+    @pytest.mark.asyncio
+    async def test_summarize_standup_stream(self, client):
+        """
+        Test streaming standup summarization.
+
+        Verifies the streamed chunks join into the summary JSON.
+        """
+        entries = [{"name": "Alice", "yesterday": "API work", "today": "Testing", "blockers": "None"}]
+
+        chunks = [chunk async for chunk in client.summarize_standup_stream(entries, sprint_goal="MVP")]
+
+        assert chunks
+        assert "summary" in json.loads("".join(chunks))
+
+    @pytest.mark.asyncio
+    async def test_summarize_standup_missing_keys(self, client):
+        """
+        Test standup summarization fills in missing entry keys.
+
+        Verifies entries without a name or plans get the client defaults.
+        """
+        client.ai_service = MagicMock()
+        client.ai_service.summarize_standup = AsyncMock(return_value=StandupSummaryResponse(summary="ok"))
+
+        await client.summarize_standup([{"today": "Testing"}])
+
+        entry = client.ai_service.summarize_standup.call_args.args[0][0]
+        assert (entry.name, entry.yesterday, entry.today, entry.blockers) == ("Unknown", "", "Testing", None)
+
     @pytest.mark.asyncio
     async def test_generate_user_stories(self, client):
         """
@@ -194,6 +243,48 @@ class TestDirectMCPClient:
         assert "configured" in result
         assert isinstance(result["configured"], bool)
 
+    @pytest.mark.asyncio
+    async def test_create_jira_ticket_success(self, client):
+        """
+        Test Jira ticket creation returns the created ticket's fields.
+        """
+        client.jira_agent = MagicMock(is_configured=True)
+        client.jira_agent.create_ticket = AsyncMock(return_value=JiraCreatedTicket(
+            key="PROJ-1", id="1", url="https://jira/browse/PROJ-1", summary="Test ticket"
+        ))
+
+        result = await client.create_jira_ticket(summary="Test ticket", description="Test description")
+
+        assert result == {
+            "success": True,
+            "ticket": {"key": "PROJ-1", "id": "1", "url": "https://jira/browse/PROJ-1", "summary": "Test ticket"},
+        }
+
+    @pytest.mark.asyncio
+    async def test_create_jira_tickets_batch(self, client):
+        """
+        Test batch ticket creation keeps input order and reports failures.
+
+        Verifies invalid and rejected tickets become error results without failing the batch.
+        """
+        client.jira_agent = MagicMock(is_configured=True)
+        client.jira_agent.create_tickets_bulk = AsyncMock(return_value=[
+            JiraCreatedTicket(key="PROJ-1", id="1", url="https://jira/browse/PROJ-1", summary="First"),
+            JiraAgentError("rejected"),
+        ])
+
+        results = await client.create_jira_tickets_batch([
+            {"summary": "First", "description": "One"},
+            {"summary": "Second", "description": "Two", "issue_type": "Unknown"},
+            {"summary": "Third", "description": "Three"},
+        ])
+
+        assert results[0]["ticket"]["summary"] == "First"
+        assert results[1]["error"] is True
+        assert results[2] == {"error": True, "message": "rejected"}
+        sent = client.jira_agent.create_tickets_bulk.call_args.args[0]
+        assert [ticket.summary for ticket in sent] == ["First", "Third"]
+
     @pytest.mark.asyncio
     async def test_create_jira_ticket_not_configured(self, client):
         """
@@ -204,8 +295,6 @@ class TestDirectMCPClient:
         """
         with patch.object(client, 'jira_agent') as mock_agent:
             mock_agent.is_configured = False
-            await client._ensure_services()
-            client.jira_agent = mock_agent
 
             result = await client.create_jira_ticket(
                 summary="Test ticket",
@@ -214,38 +303,61 @@ class TestDirectMCPClient:
 
             assert "error" in result or "configured" in str(result).lower()
 
+    def test_services_initialized_on_construction(self, client):
+        """
+        Test AI and Jira services are resolved when the client is built.
+
+        Verifies no method call is needed before the services are set.
+        """
+        assert client.ai_service is not None
+        assert client.jira_agent is not None
+
     @pytest.mark.asyncio
-    async def test_ensure_services_initialization(self, client):
+    async def test_batch_returns_results_in_order(self, client):
         """
-        Test lazy initialization of AI and Jira services.
+        Test batch runs several tools and keeps the call order.
 
-        Verifies services are None before first use and
-        initialized after _ensure_services call.
+        Verifies each result lines up with its call.
         """
-        assert client.ai_service is None
-        assert client.jira_agent is None
+        results = await client.batch([
+            ("get_jira_status", {}),
+            ("suggest_sprint_tasks", {"user_stories": ["As a user, I want to log in"]}),
+        ], concurrency=1)
 
-        await client._ensure_services()
+        assert "configured" in results[0]
+        assert "tasks" in results[1]
 
-        assert client.ai_service is not None
-        assert client.jira_agent is not None
+    @pytest.mark.asyncio
+    async def test_batch_rejects_unknown_tool(self, client):
+        """
+        Test batch refuses names that are not client tools.
+        """
+        with pytest.raises(ValueError, match="aclose"):
+            await client.batch([("aclose", {})])
 
     @pytest.mark.asyncio
-    async def test_ensure_services_called_once(self, client):
+    async def test_aclose_closes_services(self, client):
+        """
+        Test aclose releases the AI service and Jira agent pools.
         """
-        Test services are only initialized once.
+        client.ai_service = AsyncMock()
+        client.jira_agent = AsyncMock()
 
-        Verifies that repeated calls to _ensure_services
-        return the same service instances.
+        await client.aclose()
+
+        client.ai_service.close.assert_awaited_once()
+        client.jira_agent.close.assert_awaited_once()
+
+    def test_services_shared_between_clients(self, client):
         """
-        await client._ensure_services()
-        ai_service = client.ai_service
-        jira_agent = client.jira_agent
+        Test clients reuse the process-wide service singletons.
 
-        await client._ensure_services()
+        Verifies a second client gets the same service instances.
+        """
+        other = DirectMCPClient()
 
-        assert client.ai_service is ai_service
-        assert client.jira_agent is jira_agent
+        assert other.ai_service is client.ai_service
+        assert other.jira_agent is client.jira_agent
 
 
 class TestGetClient:
@@ -264,16 +376,31 @@ class TestGetClient:
         client = get_client()
         assert isinstance(client, DirectMCPClient)
 
-    def test_get_client_new_instance(self):
+    @pytest.mark.asyncio
+    async def test_aget_client_builds_in_thread_once(self):
+        """
+        Test aget_client builds the client off the event loop on first use.
+
+        Verifies later calls return the cached singleton without a thread hop.
+        """
+        get_client.cache_clear()
+
+        with patch("app.mcp_client.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            client1 = await aget_client()
+            client2 = await aget_client()
+
+        assert client1 is client2 is get_client()
+        to_thread.assert_called_once()
+
+    def test_get_client_returns_singleton(self):
         """
-        Test get_client returns new instance each time.
+        Test get_client returns the same instance each time.
 
-        Verifies that each call creates a fresh client
-        (not a singleton).
+        Verifies callers share one client and its connection pools.
         """
         client1 = get_client()
         client2 = get_client()
-        assert client1 is not client2
+        assert client1 is client2
 
 
 class TestDirectMCPClientIntegration:
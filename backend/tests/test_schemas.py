@@ -28,6 +28,8 @@ Usage:
 Author: AI Sprint Companion Team
 """
 
+import json
+
 import pytest
 from pydantic import ValidationError
 
@@ -47,6 +49,8 @@ from app.schemas import (
     JiraTicketResponse,
     JiraBulkCreateRequest,
     JiraBulkCreateResponse,
+    to_json_bytes,
+    validate_standup_entries,
 )
 
 
@@ -526,3 +530,31 @@ class TestJiraSchemas:
         assert response.total_created == 1
         assert response.total_failed == 1
 
+
+class TestMCPToolHelpers:
+    """
+    Test suite for the helpers shared by the MCP server and client.
+    """
+
+    def test_validate_standup_entries_defaults_missing_fields(self):
+        """
+        Test tool standup entries default missing name/yesterday/today.
+
+        Verifies partial entries validate while blockers stay optional.
+        """
+        entries = validate_standup_entries([{"today": "Testing"}])
+
+        assert entries[0].name == "Unknown"
+        assert entries[0].yesterday == ""
+        assert entries[0].today == "Testing"
+        assert entries[0].blockers is None
+
+    def test_to_json_bytes_round_trips_result(self):
+        """
+        Test tool results serialize to JSON that loads back unchanged.
+
+        Verifies non-string keys and non-JSON values are stringified.
+        """
+        payload = to_json_bytes({"tasks": [{"title": "T"}], 1: "one", "error": ValueError("bad")})
+
+        assert json.loads(payload) == {"tasks": [{"title": "T"}], "1": "one", "error": "bad"}
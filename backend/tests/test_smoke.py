@@ -1,12 +1,14 @@
 """Smoke tests for AI Sprint Companion API."""
 import os
 import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
 from fastapi.testclient import TestClient
 
 # Force mock mode for tests
 os.environ["AI_PROVIDER"] = "mock"
 
-from app.main import app
+from app.jira_agent import JiraAgentError, JiraCreatedTicket
+from app.main import _TokenBucket, app
 
 
 @pytest.fixture
@@ -49,6 +51,12 @@ class TestHomeEndpoint:
         # Template rendering in test client may return empty due to async context
         # The important check is that we get HTML content-type and 200 status
 
+    def test_home_is_cacheable(self, client):
+        """Home page should be served with a Cache-Control header."""
+        response = client.get("/")
+        assert response.headers["cache-control"] == "public, max-age=60"
+        assert "AI Sprint Companion" in response.text
+
 
 class TestStandupEndpoints:
     """Tests for standup summary endpoints."""
@@ -80,6 +88,25 @@ class TestStandupEndpoints:
         assert "key_blockers" in data
         assert "action_items" in data
 
+    def test_standup_stream_api_returns_json(self, client):
+        """Streaming standup API should emit the summary JSON."""
+        payload = {
+            "entries": [
+                {
+                    "name": "Alice",
+                    "yesterday": "Completed user auth",
+                    "today": "Working on dashboard",
+                    "blockers": None
+                }
+            ]
+        }
+
+        response = client.post("/api/standup/summarize/stream", json=payload)
+        assert response.status_code == 200
+
+        data = response.json()
+        assert "summary" in data
+
     def test_standup_api_requires_entries(self, client):
         """Standup API should require at least one entry."""
         payload = {"entries": []}
@@ -144,6 +171,22 @@ class TestSprintTasksEndpoints:
         assert "recommendations" in data
         assert isinstance(data["tasks"], list)
 
+    def test_tasks_api_totals_estimates_locally(self, client):
+        """Tasks API should replace a mis-added model total with the sum of task estimates."""
+        model_reply = (
+            '{"tasks": ['
+            '{"title": "A", "description": "a", "estimated_hours": 1.5},'
+            '{"title": "B", "description": "b", "estimated_hours": 2}'
+            '], "total_estimated_hours": 10}'
+        )
+        payload = {"user_stories": ["As a user, I want to login so that I can access my account"]}
+
+        with patch("app.ai.AIService._chat_completion", AsyncMock(return_value=model_reply)):
+            response = client.post("/api/tasks/suggest", json=payload)
+
+        assert response.status_code == 200
+        assert response.json()["total_estimated_hours"] == 3.5
+
     def test_tasks_api_requires_stories(self, client):
         """Tasks API should require at least one story."""
         payload = {"user_stories": []}
@@ -152,6 +195,121 @@ class TestSprintTasksEndpoints:
         assert response.status_code == 422  # Validation error
 
 
+class TestJiraEndpoints:
+    """Tests for Jira integration endpoints."""
+
+    def test_bulk_create_reports_created_and_failed(self, client):
+        """Bulk create should report each ticket's outcome in request order."""
+        agent = MagicMock(is_configured=True)
+        agent.create_tickets_bulk = AsyncMock(return_value=[
+            JiraCreatedTicket(key="PROJ-1", id="1", url="https://jira/browse/PROJ-1", summary="First"),
+            JiraAgentError("rejected"),
+        ])
+        payload = {
+            "tickets": [
+                {"summary": "First", "description": "One"},
+                {"summary": "Second", "description": "Two"},
+            ]
+        }
+
+        with patch("app.main.get_jira_agent", return_value=agent):
+            response = client.post("/api/jira/tickets/bulk", json=payload)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_created"] == 1
+        assert data["created"][0]["key"] == "PROJ-1"
+        assert data["failed"][0]["summary"] == "Second"
+
+    def test_bulk_create_rate_limited_per_client(self, client):
+        """Bulk create should return 429 once the client's bucket is empty."""
+        agent = MagicMock(is_configured=True)
+        agent.create_tickets_bulk = AsyncMock(return_value=[JiraAgentError("rejected")])
+        payload = {"tickets": [{"summary": "First", "description": "One"}]}
+
+        with patch("app.main.get_jira_agent", return_value=agent), \
+                patch("app.main._bulk_rate_limiter", return_value=_TokenBucket(1)):
+            first = client.post("/api/jira/tickets/bulk", json=payload)
+            second = client.post("/api/jira/tickets/bulk", json=payload)
+
+        assert first.status_code == 200
+        assert second.status_code == 429
+        agent.create_tickets_bulk.assert_awaited_once()
+
+    def test_bulk_create_rejects_too_many_tickets(self, client):
+        """Bulk create should reject more than 100 tickets."""
+        payload = {"tickets": [{"summary": f"T{i}", "description": "D"} for i in range(101)]}
+
+        response = client.post("/api/jira/tickets/bulk", json=payload)
+        assert response.status_code == 422
+
+    def test_create_all_stories_parses_json_body(self, client):
+        """Create-all stories should build one ticket per story in the JSON body."""
+        agent = MagicMock(is_configured=True)
+        agent.create_tickets_bulk = AsyncMock(return_value=[
+            JiraCreatedTicket(key="PROJ-1", id="1", url="https://jira/browse/PROJ-1", summary="Login"),
+        ])
+        stories = [{"title": "Login", "description": "As a user...", "acceptance_criteria": ["Works"]}]
+
+        with patch("app.main.get_jira_agent", return_value=agent):
+            response = client.post("/jira/create-all-stories", json=stories)
+
+        assert response.status_code == 200
+        assert "PROJ-1" in response.text
+        tickets = agent.create_tickets_bulk.call_args.args[0]
+        assert tickets[0].summary == "Login"
+        assert "* Works" in tickets[0].description
+
+    def test_create_all_standup_items_share_context(self, client):
+        """Create-all standup items should add the standup context to every ticket."""
+        agent = MagicMock(is_configured=True)
+        agent.create_tickets_bulk = AsyncMock(return_value=[JiraAgentError("rejected")] * 2)
+        data = {"blockers": ["DB down"], "action_items": ["Restart DB"], "summary": "Team is blocked"}
+
+        with patch("app.main.get_jira_agent", return_value=agent):
+            response = client.post("/jira/create-all-standup-items", json=data)
+
+        assert response.status_code == 200
+        blocker, action = agent.create_tickets_bulk.call_args.args[0]
+        assert blocker.description.startswith("h3. Blocker\nDB down\n\nh3. Standup Context\nTeam is blocked\n")
+        assert action.description.startswith("h3. Action Item\nRestart DB\n\nh3. Standup Context\n")
+
+
+class TestUploadSizeLimit:
+    """Tests for rejecting oversize uploads."""
+
+    def test_htmx_upload_too_large_returns_partial(self, client):
+        """HTMX uploads over the limit should get the error partial with 200 so it is swapped in."""
+        with patch("app.main.get_settings") as mock_settings:
+            mock_settings.return_value.max_upload_bytes = 10
+            response = client.post(
+                "/standup/summarize",
+                data={"entries_text": "x" * 100},
+                headers={"HX-Request": "true"},
+            )
+
+        assert response.status_code == 200
+        assert "The uploaded file is too large." in response.text
+
+    def test_page_upload_too_large_returns_413(self, client):
+        """Non-HTMX page uploads over the limit should get the error partial with 413."""
+        with patch("app.main.get_settings") as mock_settings:
+            mock_settings.return_value.max_upload_bytes = 10
+            response = client.post("/standup/summarize", data={"entries_text": "x" * 100})
+
+        assert response.status_code == 413
+        assert "The uploaded file is too large." in response.text
+
+    def test_api_upload_too_large_returns_json(self, client):
+        """API requests over the limit should get a JSON 413."""
+        with patch("app.main.get_settings") as mock_settings:
+            mock_settings.return_value.max_upload_bytes = 10
+            response = client.post("/api/standup/summarize", json={"entries": [{"name": "A" * 100}]})
+
+        assert response.status_code == 413
+        assert response.json() == {"detail": "The uploaded file is too large."}
+
+
 class TestAPIDocumentation:
     """Tests for API documentation endpoints."""
 